@@ -1,16 +1,22 @@
-from PyQt6.QtCore import QDate, QTime
+from PyQt6.QtCore import QDateTime
 from logger_setup import logger
-from typing import Dict, Any, Callable, Tuple, List
+from typing import Any, Callable, Tuple, List, Optional, Mapping
 
-def add_lily_note_data(main_window_instance: Any,
-                       widget_names: Dict[str, str],
+# (field name, widget method, date/time format) read from the widgets on every commit
+_WIDGET_READERS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ('lily_date', 'date', 'yyyy-MM-dd'),
+    ('lily_time', 'time', 'hh:mm:ss'),
+    ('lily_notes', 'toPlainText', None),
+)
+
+
+def add_lily_note_data(widgets: Mapping[str, Any],
                        db_insert_method: Callable[..., None]) -> None:
     """
     Add Lily note data to the database.
 
     Args:
-        main_window_instance: The instance of the main window.
-        widget_names: A dictionary containing the names of the widgets.
+        widgets: The input widgets keyed by field name, resolved once by the main window.
         db_insert_method: The method used to insert data into the database.
 
     Returns:
@@ -20,35 +26,26 @@ def add_lily_note_data(main_window_instance: Any,
         Exception: If an error occurs while adding Lily note data.
 
     """
-    widget_methods: Dict[str, Tuple[str, str, str]] = {
-        widget_names['lily_date']: (None, 'date', 'yyyy-MM-dd'),
-        widget_names['lily_time']: (None, 'time', 'hh:mm:ss'),
-        widget_names['lily_notes']: (widget_names['lily_notes'], 'toPlainText', ""),
-        
-    }
-    
     data_to_insert: List[Any] = []
-    for widget_name, (widget_attr, method, format_type) in widget_methods.items():
-        widget = getattr(main_window_instance, widget_name)
-        value = getattr(widget, method)()
+    for key, method, format_type in _WIDGET_READERS:
+        value = getattr(widgets[key], method)()
         if format_type:
             value = value.toString(format_type)
         data_to_insert.append(value)
     
     try:
         db_insert_method(*data_to_insert)
-        reset_lily_note_data(main_window_instance, widget_names)
+        reset_lily_note_data(widgets)
     except Exception as e:
         logger.error(f"Error occurred while adding Lily note data: {e}")
 
 
-def reset_lily_note_data(main_window_instance: Any, widget_names: Dict[str, str]) -> None:
+def reset_lily_note_data(widgets: Mapping[str, Any]) -> None:
     """
     Resets the Lily note data in the main window.
 
     Args:
-        main_window_instance: An instance of the main window.
-        widget_names: A dictionary containing the names of the widgets.
+        widgets: The input widgets keyed by field name, resolved once by the main window.
 
     Returns:
         None
@@ -57,10 +54,9 @@ def reset_lily_note_data(main_window_instance: Any, widget_names: Dict[str, str]
         Exception: If an error occurs while resetting the Lily mood form.
     """
     try:
-        getattr(main_window_instance, widget_names['lily_date']).setDate(QDate.currentDate())
-        getattr(main_window_instance, widget_names['lily_time']).setTime(QTime.currentTime())
-        getattr(main_window_instance, widget_names['lily_notes']).clear()
-        # Assuming there is a model for each day
-        getattr(main_window_instance, widget_names['model']).select()
+        now = QDateTime.currentDateTime()
+        widgets['lily_date'].setDate(now.date())
+        widgets['lily_time'].setTime(now.time())
+        widgets['lily_notes'].clear()
     except Exception as e:
         logger.error(f"Error occurred while resetting Lily mood form: {e}")
@@ -1,16 +1,24 @@
-from PyQt6.QtCore import QDate, QTime
+from PyQt6.QtCore import QDateTime
 from logger_setup import logger
-from typing import Dict, Any, Tuple, Callable, Optional
+from typing import Any, Tuple, Callable, Optional, Mapping
 
-def add_lily_mood_data(main_window_instance: Any,
-                       widget_names: Dict[str, str],
+# (field name, widget method, date/time format) read from the widgets on every commit
+_WIDGET_READERS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ('lily_date', 'date', 'yyyy-MM-dd'),
+    ('lily_time', 'time', 'hh:mm:ss'),
+    ('lily_mood_slider', 'value', None),
+    ('lily_mood_activity_slider', 'value', None),
+    ('lily_energy_slider', 'value', None),
+)
+
+
+def add_lily_mood_data(widgets: Mapping[str, Any],
                        db_insert_method: Callable[..., None]) -> None:
     """
     Add Lily's mood data to the database.
 
     Args:
-        main_window_instance: The instance of the main window.
-        widget_names: A dictionary containing the names of the widgets.
+        widgets: The input widgets keyed by field name, resolved once by the main window.
         db_insert_method: The method used to insert data into the database.
 
     Returns:
@@ -20,48 +28,36 @@ def add_lily_mood_data(main_window_instance: Any,
         Exception: If an error occurs while adding Lily's mood data.
 
     """
-    widget_methods: Dict[str, Tuple[Optional[str], str, Optional[str]]] = {
-        widget_names['lily_date']: (None, 'date', 'yyyy-MM-dd'),
-        widget_names['lily_time']: (None, 'time', 'hh:mm:ss'),
-        widget_names['lily_mood_slider']: (None, 'value', None),
-        widget_names['lily_mood_activity_slider']: (None, 'value', None),
-        widget_names['lily_energy_slider']: (None, 'value', None),
-    }
-    
     data_to_insert = []
-    for widget_name, (widget_attr, method, format_type) in widget_methods.items():
-        widget = getattr(main_window_instance, widget_name)
-        value = getattr(widget, method)()
+    for key, method, format_type in _WIDGET_READERS:
+        value = getattr(widgets[key], method)()
         if format_type:
             value = value.toString(format_type)
         data_to_insert.append(value)
     
     try:
         db_insert_method(*data_to_insert)
-        reset_lily_mood_data(main_window_instance, widget_names)
+        reset_lily_mood_data(widgets)
     except Exception as e:
         logger.error(f"Error occurred while adding Lily mood data: {e}")
 
 
-def reset_lily_mood_data(main_window_instance: Any,
-                         widget_names: Dict[str, str]) -> None:
+def reset_lily_mood_data(widgets: Mapping[str, Any]) -> None:
     """
-    Reset the Lily mood form by setting the date, time, sliders, and model to their default values.
+    Reset the Lily mood form by setting the date, time, and sliders to their default values.
 
     Parameters:
-    - main_window_instance: The instance of the main window where the widgets are located.
-    - widget_names: A dictionary containing the names of the widgets used in the form.
+    - widgets: The input widgets keyed by field name, resolved once by the main window.
 
     Returns:
     None
     """
     try:
-        getattr(main_window_instance, widget_names['lily_date']).setDate(QDate.currentDate())
-        getattr(main_window_instance, widget_names['lily_time']).setTime(QTime.currentTime())
-        getattr(main_window_instance, widget_names['lily_mood_slider']).setValue(0)
-        getattr(main_window_instance, widget_names['lily_mood_activity_slider']).setValue(0)
-        getattr(main_window_instance, widget_names['lily_energy_slider']).setValue(0)
-        # Assuming there is a model for each day
-        getattr(main_window_instance, widget_names['model']).select()
+        now = QDateTime.currentDateTime()
+        widgets['lily_date'].setDate(now.date())
+        widgets['lily_time'].setTime(now.time())
+        widgets['lily_mood_slider'].setValue(0)
+        widgets['lily_mood_activity_slider'].setValue(0)
+        widgets['lily_energy_slider'].setValue(0)
     except Exception as e:
         logger.error(f"Error occurred while resetting Lily mood form: {e}")
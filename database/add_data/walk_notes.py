@@ -1,17 +1,22 @@
-from PyQt6.QtCore import QDate, QTime
+from PyQt6.QtCore import QDateTime
 from logger_setup import logger
-from typing import Dict, Any, Callable, Tuple, List
+from typing import Any, Callable, Tuple, List, Optional, Mapping
 
+# (field name, widget method, date/time format) read from the widgets on every commit
+_WIDGET_READERS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    ('lily_date', 'date', 'yyyy-MM-dd'),
+    ('lily_time', 'time', 'hh:mm:ss'),
+    ('lily_walk_note', 'text', None),
+)
 
-def add_lily_walk_notes(main_window_instance: Any,
-                       widget_names: Dict[str, str],
-                       db_insert_method: Callable[..., None]) -> None:
+
+def add_lily_walk_notes(widgets: Mapping[str, Any],
+                        db_insert_method: Callable[..., None]) -> None:
     """
     Add Lily's walk data to the database.
 
     Args:
-        main_window_instance: The instance of the main window.
-        widget_names: A dictionary containing the names of the widgets used for data input.
+        widgets: The input widgets keyed by field name, resolved once by the main window.
         db_insert_method: The method used to insert data into the database.
 
     Returns:
@@ -21,45 +26,35 @@ def add_lily_walk_notes(main_window_instance: Any,
         Exception: If an error occurs while adding Lily's walk data.
 
     """
-    widget_methods: Dict[str, Tuple[Any, str, str]] = {
-        widget_names['lily_date']: (None, 'date', 'yyyy-MM-dd'),
-        widget_names['lily_time']: (None, 'time', 'hh:mm:ss'),
-        widget_names['lily_walk_note']: (None, 'text', ""),
-    }
-    
     data_to_insert: List[Any] = []
-    for widget_name, (widget_attr, method, format_type) in widget_methods.items():
-        widget = getattr(main_window_instance, widget_name)
-        value = getattr(widget, method)()
+    for key, method, format_type in _WIDGET_READERS:
+        value = getattr(widgets[key], method)()
         if format_type:
             value = value.toString(format_type)
         data_to_insert.append(value)
     
     try:
         db_insert_method(*data_to_insert)
-        reset_lily_walk_notes(main_window_instance, widget_names)
+        reset_lily_walk_notes(widgets)
     except Exception as e:
         logger.error(f"Error occurred while adding Lily mood data: {e}")
 
 
-def reset_lily_walk_notes(main_window_instance: Any,
-                         widget_names: Dict[str, str]) -> None:
+def reset_lily_walk_notes(widgets: Mapping[str, Any]) -> None:
     """
     Reset the data in the Lily walk form.
 
     Parameters:
-    - main_window_instance: The instance of the main window.
-    - widget_names: A dictionary containing the names of the widgets used in the form.
+    - widgets: The input widgets keyed by field name, resolved once by the main window.
 
     Returns:
     None
     """
     try:
-        getattr(main_window_instance, widget_names['lily_date']).setDate(QDate.currentDate())
-        getattr(main_window_instance, widget_names['lily_time']).setTime(QTime.currentTime())
-        getattr(main_window_instance, widget_names['lily_walk_note']).clear()
+        now = QDateTime.currentDateTime()
+        widgets['lily_date'].setDate(now.date())
+        widgets['lily_time'].setTime(now.time())
+        widgets['lily_walk_note'].clear()
         
-        # Assuming there is a model for each day
-        getattr(main_window_instance, widget_names['model']).select()
     except Exception as e:
         logger.error(f"Error occurred while resetting Lily mood form: {e}")
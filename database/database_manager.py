@@ -1,43 +1,259 @@
 import tracker_config as tkc
-from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+from PyQt6.QtCore import QTimer
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+from PyQt6.QtWidgets import QAbstractItemView, QTableView
+import functools
+from collections import deque
 import os
 import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
 from logger_setup import logger
-from typing import List, Union, Tuple, Dict, Any, Optional
+from database.database_utility.model_setup import create_and_set_model
+from database.database_utility.storage_worker import PacketLogEntry, StorageWorker
+from typing import List, Tuple, Dict, Any, Optional, Final, Iterator, Callable
 
 # from sexy_logger import logger
 
-user_dir: str = os.path.expanduser('~')
-db_path: str = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
-target_db_path: str = os.path.join(user_dir, tkc.DB_NAME)  # Database Name
+USER_DIR: Final[Path] = Path.home()
+DB_PATH: Final[Path] = Path.cwd() / tkc.DB_NAME  # Database Name
+TARGET_DB_PATH: Final[Path] = USER_DIR / tkc.DB_NAME  # Database Name
+
+
+# page_size has to be set before the switch to WAL to take effect on an existing database
+_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA page_size=4096",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# bump when the table definitions change, so existing databases run setup_tables again
+SCHEMA_VERSION: Final[int] = 1
+_TABLES: Final[Tuple[str, ...]] = (
+    'lily_diet_table',
+    'lily_mood_table',
+    'lily_walk_table',
+    'lily_in_room_table',
+    'lily_notes_table',
+    'lily_walk_notes_table',
+)
+
+_SQL_CREATE_NOTES: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_notes_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    lily_notes TEXT,
+    ts INTEGER
+    )"""
+_SQL_INSERT_NOTES: Final[str] = """INSERT INTO lily_notes_table(
+    lily_date, lily_time, lily_notes, ts)
+    VALUES (?, ?, ?, ?)"""
+_SQL_INDEX_NOTES: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_notes_table_date ON lily_notes_table(lily_date)"
+
+_SQL_CREATE_IN_ROOM: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_in_room_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    time_in_room_slider INTEGER,
+    ts INTEGER
+    )"""
+_SQL_INSERT_IN_ROOM: Final[str] = """INSERT INTO lily_in_room_table(
+    lily_date, lily_time, time_in_room_slider, ts)
+    VALUES (?, ?, ?, ?)"""
+_SQL_INDEX_IN_ROOM: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_in_room_table_date ON lily_in_room_table(lily_date)"
+
+_SQL_CREATE_DIET: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_diet_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    ts INTEGER
+    )"""
+_SQL_INSERT_DIET: Final[str] = """INSERT INTO lily_diet_table(
+    lily_date, lily_time, ts)
+    VALUES (?, ?, ?)"""
+_SQL_INDEX_DIET: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_diet_table_date ON lily_diet_table(lily_date)"
+
+_SQL_CREATE_MOOD: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_mood_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    lily_mood_slider INTEGER,
+    lily_mood_activity_slider INTEGER,
+    lily_energy_slider INTEGER,
+    ts INTEGER
+    )"""
+_SQL_INSERT_MOOD: Final[str] = """INSERT INTO lily_mood_table(
+    lily_date, lily_time, lily_mood_slider, lily_mood_activity_slider, lily_energy_slider, ts)
+    VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_INDEX_MOOD: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_mood_table_date ON lily_mood_table(lily_date)"
+
+_SQL_CREATE_WALK: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_walk_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    lily_behavior INTEGER,
+    lily_gait INTEGER,
+    ts INTEGER
+    )"""
+_SQL_INSERT_WALK: Final[str] = """INSERT INTO lily_walk_table(
+    lily_date, lily_time, lily_behavior, lily_gait, ts)
+    VALUES (?, ?, ?, ?, ?)"""
+_SQL_INDEX_WALK: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_walk_table_date ON lily_walk_table(lily_date)"
+
+_SQL_CREATE_WALK_NOTES: Final[str] = """
+    CREATE TABLE IF NOT EXISTS lily_walk_notes_table (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    lily_date TEXT,
+    lily_time TEXT,
+    lily_walk_note TEXT,
+    ts INTEGER
+    )"""
+_SQL_INSERT_WALK_NOTES: Final[str] = """INSERT INTO lily_walk_notes_table(
+    lily_date, lily_time, lily_walk_note, ts)
+    VALUES (?, ?, ?, ?)"""
+_SQL_INDEX_WALK_NOTES: Final[str] = "CREATE INDEX IF NOT EXISTS idx_lily_walk_notes_table_date ON lily_walk_notes_table(lily_date)"
+
+# for tables created before the ts column existed; ts is backfilled from the text columns as local time
+_SQL_ADD_TS: Final[str] = "ALTER TABLE {table} ADD COLUMN ts INTEGER"
+_SQL_BACKFILL_TS: Final[str] = """UPDATE {table}
+    SET ts = CAST(strftime('%s', lily_date || ' ' || lily_time, 'utc') AS INTEGER)
+    WHERE ts IS NULL"""
+_SQL_INDEX_TS: Final[str] = "CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table}(ts)"
+
+# ANALYZE creates sqlite_stat1, so its absence means the planner has no statistics yet
+_SQL_HAS_STATS: Final[str] = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+
+# the placeholder counts are fixed, so they are checked once at import instead of on every insert
+assert _SQL_INSERT_NOTES.count('?') == 4
+assert _SQL_INSERT_IN_ROOM.count('?') == 4
+assert _SQL_INSERT_DIET.count('?') == 3
+assert _SQL_INSERT_MOOD.count('?') == 6
+assert _SQL_INSERT_WALK.count('?') == 5
+assert _SQL_INSERT_WALK_NOTES.count('?') == 4
+
+
+def _apply_pragmas(db: QSqlDatabase) -> None:
+    """
+    Applies the connection PRAGMAs to an open database.
+
+    WAL removes the rollback journal's double fsync and lets readers run alongside the writer;
+    synchronous=NORMAL only fsyncs at checkpoints. The resulting journal mode is logged.
+
+    Args:
+        db (QSqlDatabase): The open database connection.
+
+    Returns:
+        None
+    """
+    query: QSqlQuery = QSqlQuery(db)
+    for pragma in _PRAGMAS:
+        if not query.exec(pragma):
+            logger.error("Error applying %s: %s", pragma, query.lastError().text())
+    if query.exec("PRAGMA journal_mode") and query.next():
+        logger.info("journal_mode: %s", query.value(0))
+    query.finish()
+
+
+def _db_insert(table_name: str) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """
+    Decorates an insert method so a failure is logged instead of raised.
+
+    Args:
+        table_name (str): The table the method writes to, used in the log message.
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(method: Callable[..., None]) -> Callable[..., None]:
+        @functools.wraps(method)
+        def wrapper(self: "DataManager", *args: Any) -> None:
+            try:
+                method(self, *args)
+            except Exception as e:
+                logger.error("Error during data insertion: %s %s", table_name, e)
+        return wrapper
+    return decorator
+
+
+def _epoch(lily_date: str, lily_time: str) -> Optional[int]:
+    """
+    Converts a row's date and time strings to a unix timestamp.
+
+    Args:
+        lily_date (str): The date in yyyy-MM-dd format.
+        lily_time (str): The local time in hh:mm:ss format.
+
+    Returns:
+        Optional[int]: The seconds since the epoch, or None if the strings could not be parsed.
+    """
+    try:
+        return int(datetime.strptime(f"{lily_date} {lily_time}", "%Y-%m-%d %H:%M:%S").timestamp())
+    except (TypeError, ValueError):
+        return None
 
 
 def initialize_database() -> None:
+    """
+    Makes sure the database file exists in the user's home directory.
+
+    The bundled database is copied when there is one, otherwise an empty file is created.
+    No connection is opened here; DataManager opens the one shared connection.
+
+    Returns:
+        None
+    """
     try:
-        if not os.path.exists(target_db_path):
-            if os.path.exists(db_path):
-                shutil.copy(db_path, target_db_path)
+        if not TARGET_DB_PATH.exists():
+            if DB_PATH.exists():
+                # copyfile skips copy()'s permission pass and uses the kernel's fast copy where available;
+                # a hardlink would share the inode, so writes would also change the bundled seed
+                shutil.copyfile(DB_PATH, TARGET_DB_PATH)
             else:
-                db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
-                db.setDatabaseName(target_db_path)
-                if not db.open():
-                    logger.error("Error: Unable to create database")
-                db.close()
+                TARGET_DB_PATH.touch()
     except Exception as e:
-        logger.error("Error: Unable to create database", str(e))
+        logger.error("Error: Unable to create database %s", e, exc_info=True)
 
 
 class DataManager:
     """
     A class that manages the database operations for Lily's Micro Module.
     
+    The insert_into_* methods do not write on the calling (GUI) thread; they buffer the row for up to
+    FLUSH_INTERVAL_MS, so a burst of clicks is handed to `storage_worker` as one batch. The worker
+    commits it in the background and emits `written` with the table name.
+    
+    Several writes that belong to one user action can be grouped into a single commit with
+    `transaction()`; inserts made inside the block reach the worker as one batch:
+    
+        with data_manager.transaction():
+            data_manager.insert_into_lily_mood_table(...)
+            data_manager.insert_into_lily_notes_table(...)
+    
     Attributes:
+        CONNECTION_NAME: The name of the shared QSqlDatabase connection used on the GUI thread.
+        FLUSH_INTERVAL_MS: How long queued inserts are buffered before they are handed to the worker.
         db: The QSqlDatabase object representing the database connection.
         query: The QSqlQuery object for executing SQL queries.
+        storage_worker: The StorageWorker thread that performs the inserts.
     
     Methods:
         __init__(self, db_name): Initializes the DataManager object and opens the database connection.
+        schema_version(self): Returns the schema version stored in the database.
         setup_tables(self): Sets up the required tables in the database.
+        transaction(self): Context manager that groups the writes made inside it into one commit.
+        force_flush(self): Hands every buffered insert to the storage worker right away.
+        create_models(self, specs): Creates and sets the QSqlTableModels for several tables in one pass.
         setup_lily_notes_table(self): Creates the lily_notes_table if it doesn't exist.
         insert_into_lily_notes_table(self, lily_date, lily_time, lily_notes): Inserts data into the lily_notes_table.
         setup_time_in_room_table(self): Creates the lily_in_room_table if it doesn't exist.
@@ -48,10 +264,15 @@ class DataManager:
         insert_into_lily_mood_table(self, lily_date, lily_time, lily_mood_slider, lily_mood_activity_slider, lily_energy_slider): Inserts data into the lily_mood_table.
         setup_wiggles_walks_table(self): Creates the lily_walk_table if it doesn't exist.
         insert_into_wiggles_walks_table(self, lily_date, lily_time, lily_behavior, lily_gait, lily_walk_note): Inserts data into the lily_walk_table.
+        close_database(self): Flushes pending inserts, checkpoints the WAL and closes the connection.
     """
+    CONNECTION_NAME: str = 'lily_main'
+    FLUSH_INTERVAL_MS: int = 250
+    # number of open DataManagers sharing CONNECTION_NAME; the last close_database closes it
+    _connection_users: int = 0
     
     def __init__(self,
-                 db_name: str = target_db_path) -> None:
+                 db_name: str = os.fspath(TARGET_DB_PATH)) -> None:
         """
         Initializes the DataManager object and opens the database connection.
 
@@ -60,18 +281,66 @@ class DataManager:
 
         Returns:
             None
+
+        Raises:
+            ValueError: If another open DataManager holds CONNECTION_NAME on a different database file;
+                reopening the shared connection would pull it out from under that instance.
         """
+        if DataManager._connection_users and QSqlDatabase.contains(self.CONNECTION_NAME):
+            open_name: str = QSqlDatabase.database(self.CONNECTION_NAME, False).databaseName()
+            if open_name != db_name:
+                raise ValueError(f"{self.CONNECTION_NAME} is already open on {open_name}, not {db_name}")
+        self._pending_entries: Optional[List[PacketLogEntry]] = None
+        self._closed: bool = False
+        # only an instance whose connection opened is counted in _connection_users
+        self._counted: bool = False
+        # write-behind buffer; the timer is not restarted by later inserts, so rows wait at most one interval
+        self._write_behind: "deque[PacketLogEntry]" = deque()
+        self._flush_timer: QTimer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.force_flush)
         try:
-            self.db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE')
-            self.db.setDatabaseName(db_name)
-            
-            if not self.db.open():
-                logger.error("Error: Unable to open database")
+            # one named connection for the GUI thread; addDatabase is only called the first time
+            if QSqlDatabase.contains(self.CONNECTION_NAME):
+                self.db: QSqlDatabase = QSqlDatabase.database(self.CONNECTION_NAME, False)
+            else:
+                self.db = QSqlDatabase.addDatabase('QSQLITE', self.CONNECTION_NAME)
+            # a connection that is already open on this file keeps its handle and PRAGMAs
+            reused: bool = self.db.isOpen() and self.db.databaseName() == db_name
+            if not reused:
+                self.db.close()
+                self.db.setDatabaseName(db_name)
+                if not self.db.open():
+                    logger.error("Error: Unable to open database - %s", self.db.lastError().text())
+            if self.db.isOpen():
+                DataManager._connection_users += 1
+                self._counted = True
             logger.info("DB INITIALIZING")
-            self.query: QSqlQuery = QSqlQuery()
-            self.setup_tables()
+            self.query: QSqlQuery = QSqlQuery(self.db)
+            # nothing can be configured on a connection that failed to open; that was logged above
+            if self._counted and not reused:
+                _apply_pragmas(self.db)
+            if self._counted and self.schema_version() < SCHEMA_VERSION:
+                self.setup_tables()
+            # inserts are queued and written on the storage worker's own connection
+            self.storage_worker: StorageWorker = StorageWorker(db_name)
+            self.storage_worker.start()
         except Exception as e:
-            logger.error(f"Error: Unable to open database {e}", exc_info=True)
+            logger.error("Error: Unable to open database %s", e, exc_info=True)
+    
+    def schema_version(self) -> int:
+        """
+        Reads the schema version stored in the database's `PRAGMA user_version`.
+
+        Returns:
+            int: The stored version, or 0 if it could not be read.
+        """
+        version: int = 0
+        if self.query.exec("PRAGMA user_version") and self.query.next():
+            version = int(self.query.value(0))
+        self.query.finish()
+        return version
     
     def setup_tables(self) -> None:
         """
@@ -84,15 +353,177 @@ class DataManager:
         - setup_time_in_room_table
         - setup_lily_notes_table
 
+        All of the DDL runs inside one transaction, so a first launch commits once
+        instead of once per table; the transaction is rolled back on failure.
+        Once every table exists, `PRAGMA user_version` is set to SCHEMA_VERSION so later launches
+        can skip this method.
+        If the database has never been analyzed (a fresh or freshly seeded file), ANALYZE runs
+        once afterwards so the planner has statistics for the indexes from the start.
+
         Returns:
             None
         """
-        self.setup_lily_diet_table()
-        self.setup_lily_mood_table()
-        self.setup_wiggles_walks_table()
-        self.setup_time_in_room_table()
-        self.setup_lily_notes_table()
-        self.setup_lily_walk_notes_table()
+        try:
+            with self.transaction():
+                self.setup_lily_diet_table()
+                self.setup_lily_mood_table()
+                self.setup_wiggles_walks_table()
+                self.setup_time_in_room_table()
+                self.setup_lily_notes_table()
+                self.setup_lily_walk_notes_table()
+                # only mark the schema as current once every table, including its ts column, is there
+                if all(self.db.record(table).contains('ts') for table in _TABLES):
+                    if not self.query.exec(f"PRAGMA user_version = {SCHEMA_VERSION}"):
+                        logger.error("Error setting schema version: %s", self.query.lastError().text())
+            if self.query.exec(_SQL_HAS_STATS) and not self.query.next():
+                if not self.query.exec("ANALYZE"):
+                    logger.error("Error analyzing database: %s", self.query.lastError().text())
+            self.query.finish()
+        except Exception as e:
+            logger.error("Error setting up tables %s", e, exc_info=True)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Groups the writes made inside the block into one commit.
+
+        Statements run on `db` are wrapped in a database transaction that is committed on exit
+        and rolled back if the block raises. Inserts queued inside the block are held back until
+        the commit and then buffered together, so they reach the storage worker in one batch;
+        they are dropped on rollback, including when the commit itself fails.
+        A nested `transaction()` block joins the outer one, which does the single commit.
+
+        Yields:
+            None
+
+        Raises:
+            RuntimeError: If the transaction cannot be started or committed.
+            Exception: Re-raises whatever the block raised, after rolling back.
+        """
+        if self._pending_entries is not None:
+            # already inside a transaction; the outermost block commits or rolls back everything
+            yield
+            return
+        if not self.db.transaction():
+            raise RuntimeError(f"Unable to start a transaction: {self.db.lastError().text()}")
+        self._pending_entries = []
+        try:
+            yield
+        except Exception:
+            self.db.rollback()
+            self._pending_entries = None
+            raise
+        pending, self._pending_entries = self._pending_entries, None
+        if not self.db.commit():
+            error: str = self.db.lastError().text()
+            self.db.rollback()
+            raise RuntimeError(f"Unable to commit the transaction, {len(pending)} held-back insert(s) dropped: {error}")
+        self._buffer(pending)
+    
+    def _buffer(self, entries: List[PacketLogEntry]) -> None:
+        """
+        Adds entries to the write-behind buffer and makes sure a flush is scheduled.
+
+        Args:
+            entries (List[PacketLogEntry]): The writes to buffer.
+
+        Returns:
+            None
+        """
+        if not entries:
+            return
+        self._write_behind.extend(entries)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def force_flush(self) -> None:
+        """
+        Hands every buffered insert to the storage worker as one batch.
+
+        Returns:
+            None
+        """
+        self._flush_timer.stop()
+        if self._write_behind:
+            entries: List[PacketLogEntry] = list(self._write_behind)
+            self._write_behind.clear()
+            self.storage_worker.submit_many(entries)
+    
+    def _ensure_ts_column(self, table: str) -> None:
+        """
+        Adds and backfills the `ts` epoch column on a table created before it existed, then indexes it.
+
+        Args:
+            table (str): The name of the table.
+
+        Returns:
+            None
+        """
+        if not self.db.record(table).contains('ts'):
+            for sql in (_SQL_ADD_TS, _SQL_BACKFILL_TS):
+                if not self.query.exec(sql.format(table=table)):
+                    logger.error("Error adding ts column: %s %s", table, self.query.lastError().text())
+                    return
+        if not self.query.exec(_SQL_INDEX_TS.format(table=table)):
+            logger.error("Error creating index: %s %s", table, self.query.lastError().text())
+    
+    def _exec_prepared(self,
+                       table: str,
+                       sql: str,
+                       rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Buffers rows for one table until the next write-behind flush, or holds them back until the
+        surrounding `transaction()` block commits.
+
+        The worker prepares `sql` once, binds and executes every row, and commits the
+        whole batch in one transaction.
+
+        Args:
+            table (str): The name of the table the rows are written to.
+            sql (str): The parameterized INSERT statement.
+            rows (List[Tuple[Any, ...]]): The bind values, one tuple per row, starting with lily_date
+                and lily_time. The trailing ts value is computed from those two.
+
+        Returns:
+            None
+        """
+        entries: List[PacketLogEntry] = [PacketLogEntry(table, sql, (*row, _epoch(row[0], row[1]))) for row in rows]
+        if self._pending_entries is not None:
+            self._pending_entries.extend(entries)
+        else:
+            self._buffer(entries)
+    
+    def create_models(self,
+                      specs: List[Tuple[str, QAbstractItemView]]) -> Dict[str, QSqlTableModel]:
+        """
+        Creates and sets up a QSqlTableModel for each (table name, view widget) pair.
+
+        All of the models' initial selects run inside one read transaction, so the database
+        is locked and unlocked once instead of once per table.
+
+        Args:
+            specs (List[Tuple[str, QAbstractItemView]]): The table names and the views to set the models on.
+
+        Returns:
+            Dict[str, QSqlTableModel]: The created models keyed by table name. Tables whose model
+            could not be created are left out and logged.
+        """
+        models: Dict[str, QSqlTableModel] = {}
+        self.db.transaction()
+        try:
+            for table_name, view_widget in specs:
+                try:
+                    model: QSqlTableModel = create_and_set_model(table_name, view_widget, self.db)
+                    # ts is for sorting and range queries; the views keep showing the text columns
+                    ts_column: int = model.fieldIndex('ts')
+                    if ts_column >= 0 and isinstance(view_widget, QTableView):
+                        view_widget.setColumnHidden(ts_column, True)
+                    models[table_name] = model
+                except Exception as e:
+                    logger.error("Error creating model: %s %s", table_name, e, exc_info=True)
+        finally:
+            self.db.commit()
+        return models
     
     def setup_lily_notes_table(self) -> None:
         """
@@ -103,19 +534,17 @@ class DataManager:
         - lily_date: TEXT
         - lily_time: TEXT
         - lily_notes: TEXT
+        - ts: INTEGER (unix epoch of lily_date and lily_time)
 
         Returns:
         - None if the table is created successfully.
         - Logs an error message if there's an error creating the table.
         """
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_notes_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT,
-                lily_notes TEXT
-                )"""):
-            logger.error(f"Error creating table: lily_notes_table", self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_NOTES):
+            logger.error("Error creating table: lily_notes_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_NOTES):
+            logger.error("Error creating index: lily_notes_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_notes_table')
     
     def insert_into_lily_notes_table(self,
                                      lily_date: str,
@@ -129,27 +558,24 @@ class DataManager:
             lily_time (str): The time of the Lily note.
             lily_notes (str): The content of the Lily note.
 
-        Raises:
-            ValueError: If the number of bind values does not match the number of placeholders in the SQL query.
+        Returns:
+            None
+        """
+        self.insert_many_into_lily_notes_table([(lily_date, lily_time, lily_notes)])
+    
+    @_db_insert('lily_notes_table')
+    def insert_many_into_lily_notes_table(self,
+                                          rows: List[Tuple[str, str, str]]) -> None:
+        """
+        Inserts several records into the lily_notes_table in one transaction.
+
+        Args:
+            rows (List[Tuple[str, str, str]]): (lily_date, lily_time, lily_notes) tuples, one per record.
 
         Returns:
             None
         """
-        sql: str = f"""INSERT INTO lily_notes_table(lily_date, lily_time, lily_notes) VALUES (?, ?, ?)"""
-        bind_values: List[str] = [lily_date, lily_time, lily_notes]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_notes_table Expected {sql.count('?')}
-                    bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(f"Error inserting data: lily_notes_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_notes_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_notes_table {e}", exc_info=True)
+        self._exec_prepared('lily_notes_table', _SQL_INSERT_NOTES, rows)
     
     ##################################################################################################################
     # Lily Diet Table
@@ -163,18 +589,16 @@ class DataManager:
         - lily_date: TEXT
         - lily_time: TEXT
         - time_in_room_slider: INTEGER
+        - ts: INTEGER (unix epoch of lily_date and lily_time)
 
         Returns:
         None
         """
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_in_room_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT,
-                time_in_room_slider INTEGER
-                )"""):
-            logger.error(f"Error creating table: lily_in_room_table", self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_IN_ROOM):
+            logger.error("Error creating table: lily_in_room_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_IN_ROOM):
+            logger.error("Error creating index: lily_in_room_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_in_room_table')
     
     def insert_into_time_in_room_table(self,
                                        lily_date: str,
@@ -188,29 +612,24 @@ class DataManager:
             lily_time (str): The time of the record.
             time_in_room_slider (int): The value of the time_in_room_slider.
 
-        Raises:
-            ValueError: If the number of bind values does not match the expected number of placeholders in the SQL query.
+        Returns:
+            None
+        """
+        self.insert_many_into_time_in_room_table([(lily_date, lily_time, time_in_room_slider)])
+    
+    @_db_insert('lily_in_room_table')
+    def insert_many_into_time_in_room_table(self,
+                                            rows: List[Tuple[str, str, int]]) -> None:
+        """
+        Inserts several records into the lily_in_room_table in one transaction.
+
+        Args:
+            rows (List[Tuple[str, str, int]]): (lily_date, lily_time, time_in_room_slider) tuples, one per record.
 
         Returns:
             None
         """
-        sql: str = f"""INSERT INTO lily_in_room_table(lily_date, lily_time,
-                                       time_in_room_slider) VALUES (?, ?, ?)"""
-        bind_values: List[Union[str, int]] = [lily_date, lily_time, time_in_room_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_in_room_table Expected {sql.count('?')}
-                    bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_in_room_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_in_room_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_in_room_table {e}", exc_info=True)
+        self._exec_prepared('lily_in_room_table', _SQL_INSERT_IN_ROOM, rows)
     
     ##################################################################################################################
     # Lily Diet Table
@@ -223,17 +642,16 @@ class DataManager:
         - id: INTEGER (Primary Key, Auto Increment)
         - lily_date: TEXT
         - lily_time: TEXT
+        - ts: INTEGER (unix epoch of lily_date and lily_time)
 
         Returns:
         None
         """
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_diet_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT
-                )"""):
-            logger.error(f"Error creating table: lily_diet_table", self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_DIET):
+            logger.error("Error creating table: lily_diet_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_DIET):
+            logger.error("Error creating index: lily_diet_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_diet_table')
     
     def insert_into_lily_diet_table(self,
                                     lily_date: str,
@@ -245,43 +663,34 @@ class DataManager:
             lily_date (str): The date of the record.
             lily_time (str): The time of the record.
 
-        Raises:
-            ValueError: If the number of bind values does not match the expected number of placeholders in the SQL query.
-
         Returns:
         None
         """
-        sql: str = f"""INSERT INTO lily_diet_table(lily_date, lily_time) VALUES (?, ?)"""
-        bind_values: List[str] = [lily_date, lily_time]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_eats_table Expected {sql.count('?')}
-                    bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_eats_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_eats_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_eats_table {e}", exc_info=True)
+        self.insert_many_into_lily_diet_table([(lily_date, lily_time)])
+    
+    @_db_insert('lily_diet_table')
+    def insert_many_into_lily_diet_table(self,
+                                         rows: List[Tuple[str, str]]) -> None:
+        """
+        Inserts several records into the lily_diet_table in one transaction.
+
+        Args:
+            rows (List[Tuple[str, str]]): (lily_date, lily_time) tuples, one per record.
+
+        Returns:
+            None
+        """
+        self._exec_prepared('lily_diet_table', _SQL_INSERT_DIET, rows)
     
     ##################################################################################################################
     #       Lily MOOD table
     ##################################################################################################################
     def setup_lily_mood_table(self) -> None:
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_mood_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT,
-                lily_mood_slider INTEGER,
-                lily_mood_activity_slider INTEGER,
-                lily_energy_slider INTEGER
-                    )"""):
-            logger.error(f"Error creating table: lily_mood_table", self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_MOOD):
+            logger.error("Error creating table: lily_mood_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_MOOD):
+            logger.error("Error creating index: lily_mood_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_mood_table')
     
     def insert_into_lily_mood_table(self,
                                     lily_date: str,
@@ -299,31 +708,25 @@ class DataManager:
             lily_mood_activity_slider (int): The mood activity slider value.
             lily_energy_slider (int): The energy slider value.
 
-        Raises:
-            ValueError: If the number of bind values does not match the expected number in the SQL query.
-
         Returns:
         None
         """
-        sql: str = f"""INSERT INTO lily_mood_table(
-        lily_date, lily_time, lily_mood_slider, lily_mood_activity_slider, lily_energy_slider)
-        VALUES (?, ?, ?, ?, ?)"""
-        bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_mood_slider,
-                                              lily_mood_activity_slider, lily_energy_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_mood_table Expected
-                    {sql.count('?')} bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_mood_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_mood_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_mood_table {e}", exc_info=True)
+        self.insert_many_into_lily_mood_table([(lily_date, lily_time, lily_mood_slider,
+                                                lily_mood_activity_slider, lily_energy_slider)])
+    
+    @_db_insert('lily_mood_table')
+    def insert_many_into_lily_mood_table(self,
+                                         rows: List[Tuple[str, str, int, int, int]]) -> None:
+        """
+        Inserts several records into the lily_mood_table in one transaction.
+
+        Args:
+            rows (List[Tuple[str, str, int, int, int]]): (lily_date, lily_time, lily_mood_slider, lily_mood_activity_slider, lily_energy_slider) tuples, one per record.
+
+        Returns:
+            None
+        """
+        self._exec_prepared('lily_mood_table', _SQL_INSERT_MOOD, rows)
     
     # Lily WALKS table
     def setup_wiggles_walks_table(self) -> None:
@@ -336,19 +739,16 @@ class DataManager:
         - lily_time: TEXT
         - lily_behavior: INTEGER
         - lily_gait: INTEGER
+        - ts: INTEGER (unix epoch of lily_date and lily_time)
 
         Returns:
         None
         """
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_walk_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT,
-                lily_behavior INTEGER,
-                lily_gait INTEGER
-                )"""):
-            logger.error(f"Error creating table: lily_walk_table", self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_WALK):
+            logger.error("Error creating table: lily_walk_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_WALK):
+            logger.error("Error creating index: lily_walk_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_walk_table')
     
     def insert_into_wiggles_walks_table(self,
                                         lily_date: str,
@@ -364,32 +764,24 @@ class DataManager:
             lily_behavior (str): The behavior during the walk.
             lily_gait (str): The gait during the walk.
 
-        Raises:
-            ValueError: If the number of bind values does not match the number of placeholders in the SQL query.
-
         Returns:
         None
         """
-        sql: str = f"""INSERT INTO lily_walk_table(
-            lily_date, lily_time, lily_behavior, lily_gait)
-            VALUES (?, ?, ?, ?)"""
-        
-        bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_behavior, lily_gait]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: lily_walk_table Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_walk_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_walk_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_walk_table", str(e))
+        self.insert_many_into_wiggles_walks_table([(lily_date, lily_time, lily_behavior, lily_gait)])
+    
+    @_db_insert('lily_walk_table')
+    def insert_many_into_wiggles_walks_table(self,
+                                             rows: List[Tuple[str, str, int, int]]) -> None:
+        """
+        Inserts several records into the lily_walk_table in one transaction.
+
+        Args:
+            rows (List[Tuple[str, str, int, int]]): (lily_date, lily_time, lily_behavior, lily_gait) tuples, one per record.
+
+        Returns:
+            None
+        """
+        self._exec_prepared('lily_walk_table', _SQL_INSERT_WALK, rows)
     
     def setup_lily_walk_notes_table(self) -> None:
         """
@@ -400,19 +792,16 @@ class DataManager:
         - lily_date: TEXT
         - lily_time: TEXT
         - lily_walk_note: TEXT
+        - ts: INTEGER (unix epoch of lily_date and lily_time)
 
         Returns:
         None
         """
-        if not self.query.exec(f"""
-                CREATE TABLE IF NOT EXISTS lily_walk_notes_table (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                lily_date TEXT,
-                lily_time TEXT,
-                lily_walk_note TEXT
-                )"""):
-            logger.error(f"Error creating table: lily_walk_notes_table",
-                         self.query.lastError().text())
+        if not self.query.exec(_SQL_CREATE_WALK_NOTES):
+            logger.error("Error creating table: lily_walk_notes_table %s", self.query.lastError().text())
+        if not self.query.exec(_SQL_INDEX_WALK_NOTES):
+            logger.error("Error creating index: lily_walk_notes_table %s", self.query.lastError().text())
+        self._ensure_ts_column('lily_walk_notes_table')
     
     def insert_into_lily_walk_notes_table(self,
                                           lily_date: str,
@@ -426,52 +815,62 @@ class DataManager:
             lily_time (str): The time of the walk.
             lily_walk_note (str): Additional notes about the walk.
 
-        Raises:
-            ValueError: If the number of bind values does not match the number of placeholders in the SQL query.
-
         Returns:
         None
         """
-        sql: str = f"""INSERT INTO lily_walk_notes_table(
-            lily_date, lily_time, lily_walk_note)
-            VALUES (?, ?, ?)"""
-        
-        bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_walk_note]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: lily_walk_notes_table Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_walk_notes_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_walk_notes_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_walk_notes_table", str(e))
-
+        self.insert_many_into_lily_walk_notes_table([(lily_date, lily_time, lily_walk_note)])
+    
+    @_db_insert('lily_walk_notes_table')
+    def insert_many_into_lily_walk_notes_table(self,
+                                               rows: List[Tuple[str, str, str]]) -> None:
+        """
+        Inserts several records into the lily_walk_notes_table in one transaction.
 
-def close_database(self) -> None:
-    """
-    Closes the database connection if it is open.
+        Args:
+            rows (List[Tuple[str, str, str]]): (lily_date, lily_time, lily_walk_note) tuples, one per record.
 
-    This function checks if the database connection is open and closes it if it is.
-    If the database is already closed or an error occurs while closing the database,
-    an exception is logged.
+        Returns:
+            None
+        """
+        self._exec_prepared('lily_walk_notes_table', _SQL_INSERT_WALK_NOTES, rows)
+    
+    def close_database(self) -> None:
+        """
+        Closes the database connection if it is open.
 
-    Args:
-        self: The instance of the database manager.
+        Buffered inserts are flushed and the storage worker is stopped first, so every queued insert
+        is committed and the worker's connection is gone. `PRAGMA optimize` then refreshes the planner statistics, and
+        `PRAGMA wal_checkpoint(TRUNCATE)` merges the WAL back into the database file and truncates
+        it, so the WAL does not keep growing across sessions.
+        The shared CONNECTION_NAME handle is only closed by the last open DataManager; calling this
+        again on the same instance does nothing.
+        If the database is already closed or an error occurs while closing the database,
+        an exception is logged.
 
-    Returns:
-        None
-    """
-    try:
-        logger.info("if database is open")
-        if self.db.isOpen():
-            logger.info("the database is closed successfully")
-            self.db.close()
-    except Exception as e:
-        logger.exception(f"Error closing database: {e}")
+        Returns:
+            None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.force_flush()
+            self.storage_worker.stop()
+            if not self._counted:
+                return
+            DataManager._connection_users -= 1
+            if DataManager._connection_users:
+                logger.info("database still used by %s other DataManager(s), keeping it open",
+                            DataManager._connection_users)
+                return
+            logger.info("if database is open")
+            if self.db.isOpen():
+                query: QSqlQuery = QSqlQuery(self.db)
+                for pragma in ("PRAGMA optimize", "PRAGMA wal_checkpoint(TRUNCATE)"):
+                    if not query.exec(pragma):
+                        logger.error("Error running %s: %s", pragma, query.lastError().text())
+                query.finish()
+                logger.info("the database is closed successfully")
+                self.db.close()
+        except Exception as e:
+            logger.exception("Error closing database: %s", e)
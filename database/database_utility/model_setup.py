@@ -1,3 +1,5 @@
+from typing import Optional
+
 from PyQt6 import QtSql
 from PyQt6.QtWidgets import QAbstractItemView
 from logger_setup import logger
@@ -5,19 +7,22 @@ from logger_setup import logger
 # model_setup.py
 
 
-def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
+def create_and_set_model(table_name: str,
+                         view_widget: QAbstractItemView,
+                         db: Optional[QtSql.QSqlDatabase] = None) -> QtSql.QSqlTableModel:
     """
     Creates and sets up a QSqlTableModel for the specified table name and view widget.
 
     Args:
         table_name (str): The name of the table to create the model for.
         view_widget (QAbstractItemView): The view widget to set the model on.
+        db (Optional[QSqlDatabase]): The connection the model reads from. Defaults to the default connection.
 
     Returns:
         QSqlTableModel: The created QSqlTableModel.
 
     """
-    model = QtSql.QSqlTableModel()
+    model = QtSql.QSqlTableModel(None, db if db is not None else QtSql.QSqlDatabase.database())
     model.setTable(table_name)
     model.setEditStrategy(QtSql.QSqlTableModel.EditStrategy.OnFieldChange)
 
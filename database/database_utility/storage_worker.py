@@ -0,0 +1,224 @@
+import queue
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from logger_setup import logger
+
+
+class PacketLogEntry(NamedTuple):
+    """
+    A single pending write for the StorageWorker.
+
+    Attributes:
+        table: The name of the table the statement writes to.
+        sql: The parameterized SQL statement.
+        params: The values bound to the statement's placeholders, in order.
+    """
+    table: str
+    sql: str
+    params: Tuple[Any, ...]
+
+
+class StorageWorker(QThread):
+    """
+    A background thread that owns its own SQLite connection and executes queued writes off the GUI thread.
+
+    Entries submitted with `submit_many` are drained in batches; every batch is written inside a single
+    transaction. Each distinct statement is prepared once per worker and reused for later batches.
+    After a batch is committed, `written` is emitted once per table touched so the GUI thread can refresh the matching models.
+
+    Attributes:
+        written: Signal emitted with the table name after rows for that table were committed.
+        CONNECTION_NAME: The prefix of the worker's connection name; each worker adds its id, so
+            several workers never replace each other's connection.
+        OPTIMIZE_EVERY: The number of written rows after which `PRAGMA optimize` is run.
+        db_name: The path to the database file.
+
+    Methods:
+        submit_many(self, entries): Queues several writes that are committed together.
+        stop(self): Processes the remaining writes and stops the thread.
+    """
+    written = pyqtSignal(str)
+
+    CONNECTION_NAME: str = 'lily_storage_worker'
+    OPTIMIZE_EVERY: int = 1000
+
+    def __init__(self,
+                 db_name: str,
+                 parent: Optional[Any] = None) -> None:
+        """
+        Initializes the StorageWorker.
+
+        Args:
+            db_name (str): The path to the database file.
+            parent: The optional QObject parent.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.db_name: str = db_name
+        self.connection_name: str = f"{self.CONNECTION_NAME}_{id(self)}"
+        # sql -> (prepared query, placeholder count), filled on first use
+        self._prepared: Dict[str, Tuple[QSqlQuery, int]] = {}
+        self._rows_since_optimize: int = 0
+        self._queue: "queue.Queue[Optional[List[PacketLogEntry]]]" = queue.Queue()
+
+    def submit_many(self, entries: List[PacketLogEntry]) -> None:
+        """
+        Queues several writes as one unit, so they are always committed in the same transaction.
+
+        Args:
+            entries (List[PacketLogEntry]): The writes to perform.
+
+        Returns:
+            None
+        """
+        if entries:
+            self._queue.put(entries)
+
+    def stop(self) -> None:
+        """
+        Processes the remaining writes, then stops the worker thread and waits for it to exit.
+
+        Returns:
+            None
+        """
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
+
+    def run(self) -> None:
+        """
+        Opens the worker's connection, then drains and writes queued entries until stopped.
+
+        Returns:
+            None
+        """
+        db: QSqlDatabase = QSqlDatabase.addDatabase('QSQLITE', self.connection_name)
+        db.setDatabaseName(self.db_name)
+        if not db.open():
+            logger.error("StorageWorker: Unable to open database - %s", db.lastError().text())
+        else:
+            pragma: QSqlQuery = QSqlQuery(db)
+            pragma.exec("PRAGMA journal_mode=WAL")
+            pragma.exec("PRAGMA synchronous=NORMAL")
+            pragma.finish()
+
+        running: bool = True
+        while running:
+            batch: List[Optional[List[PacketLogEntry]]] = [self._queue.get()]
+            # drain whatever else is already waiting so it lands in the same transaction
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            entries: List[PacketLogEntry] = []
+            for item in batch:
+                if item is not None:
+                    entries.extend(item)
+            try:
+                self._write_batch(db, entries)
+            except Exception as e:
+                logger.error("StorageWorker: Error writing batch %s", e, exc_info=True)
+
+        # prepared statements must be released before the connection is removed
+        self._prepared.clear()
+        db.close()
+        del db
+        QSqlDatabase.removeDatabase(self.connection_name)
+
+    def _prepared_query(self,
+                        db: QSqlDatabase,
+                        table: str,
+                        sql: str) -> Optional[Tuple[QSqlQuery, int]]:
+        """
+        Returns the worker's prepared QSqlQuery for a statement, preparing it on first use.
+
+        The statement's placeholder count is computed once, when it is prepared, and cached with it.
+
+        Args:
+            db (QSqlDatabase): The worker's open connection.
+            table (str): The table the statement writes to, used for logging.
+            sql (str): The parameterized SQL statement.
+
+        Returns:
+            Optional[Tuple[QSqlQuery, int]]: The prepared query and its placeholder count, or None if
+            the statement could not be prepared.
+        """
+        prepared: Optional[Tuple[QSqlQuery, int]] = self._prepared.get(sql)
+        if prepared is None:
+            query: QSqlQuery = QSqlQuery(db)
+            if not query.prepare(sql):
+                logger.error("Error preparing insert: %s - %s", table, query.lastError().text())
+                return None
+            prepared = (query, sql.count('?'))
+            self._prepared[sql] = prepared
+        return prepared
+
+    def _write_batch(self,
+                     db: QSqlDatabase,
+                     entries: List[PacketLogEntry]) -> None:
+        """
+        Writes a batch of entries inside one transaction, reusing the cached prepared statements.
+
+        The rows of each statement are bound column by column and run with a single execBatch call.
+        Rows whose length does not match the statement's placeholder count are logged and skipped,
+        so they cannot shift values into the wrong columns; the rest of the batch is still written.
+
+        Args:
+            db (QSqlDatabase): The worker's open connection.
+            entries (List[PacketLogEntry]): The writes to perform.
+
+        Returns:
+            None
+        """
+        if not entries or not db.isOpen():
+            return
+
+        grouped: Dict[Tuple[str, str], List[Tuple[Any, ...]]] = {}
+        for entry in entries:
+            grouped.setdefault((entry.table, entry.sql), []).append(entry.params)
+
+        db.transaction()
+        written_tables: List[str] = []
+        for (table, sql), rows in grouped.items():
+            prepared: Optional[Tuple[QSqlQuery, int]] = self._prepared_query(db, table, sql)
+            if prepared is None:
+                continue
+            query, placeholders = prepared
+            valid: List[Tuple[Any, ...]] = [row for row in rows if len(row) == placeholders]
+            if len(valid) != len(rows):
+                logger.error("Dropped %s of %s row(s) for %s: expected %s values per row",
+                             len(rows) - len(valid), len(rows), table, placeholders)
+            if not valid:
+                continue
+            # bind one list per placeholder, so Qt loops over the rows instead of Python
+            for column in zip(*valid):
+                query.addBindValue(list(column))
+            if not query.execBatch():
+                logger.error("Error inserting data: %s - %s", table, query.lastError().text())
+            # reset the statement for the next batch without re-preparing it
+            query.finish()
+            if table not in written_tables:
+                written_tables.append(table)
+        if not db.commit():
+            logger.error("Error committing batch - %s", db.lastError().text())
+            db.rollback()
+            return
+
+        for table in written_tables:
+            self.written.emit(table)
+
+        # refresh the planner statistics as the tables grow
+        self._rows_since_optimize += len(entries)
+        if self._rows_since_optimize >= self.OPTIMIZE_EVERY:
+            self._rows_since_optimize = 0
+            optimize: QSqlQuery = QSqlQuery(db)
+            if not optimize.exec("PRAGMA optimize"):
+                logger.error("Error optimizing database: %s", optimize.lastError().text())
+            optimize.finish()
@@ -1,3 +1,4 @@
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication
 from ui.main_window import MainWindow
 import sys
@@ -22,7 +23,10 @@ def run_app():
         app = QApplication(sys.argv)
         window = MainWindow()
         window.show()
-        sys.exit(app.exec())
+        exit_code = app.exec()
+        # let the settings write started by closeEvent finish
+        QThreadPool.globalInstance().waitForDone()
+        sys.exit(exit_code)
     except Exception as e:
         logger.error(f"Error at portal {e}", exc_info=True)
     
@@ -2,11 +2,17 @@
 from logger_setup import logger
 from typing import Any
 
+# bound once so change_lily_stack skips the module-global + attribute lookup per call
+_log_error = logger.error
+_log_info = logger.info
+
 
 def change_lily_stack(lilyStack: Any, index: int) -> None:
     """
     Change the current index of the alpha stack.
 
+    Does nothing (and logs nothing) when the stack is already on the requested index.
+
     Args:
     stack_alpha (Any): The alpha stack object.
     index (int): The new index to set.
@@ -15,9 +21,11 @@ def change_lily_stack(lilyStack: Any, index: int) -> None:
     None
     """
     try:
+        if lilyStack.currentIndex() == index:
+            return
         lilyStack.setCurrentIndex(index)
-        logger.info("Alpha Stack Page Change")
+        _log_info("Alpha Stack Page Change")
     except Exception as e:
-        logger.error(f"Alpha Stack Page Change Error: {e}", exc_info=True)
+        _log_error(f"Alpha Stack Page Change Error: {e}", exc_info=True)
         
         
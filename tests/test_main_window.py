@@ -0,0 +1,44 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# keep the database, log and settings files out of the real home directory; these must be set
+# before the application modules are imported, because they resolve their paths at import time
+_HOME = tempfile.mkdtemp(prefix="lily_tests_")
+os.environ["HOME"] = _HOME
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+_app = QApplication.instance() or QApplication([])
+
+import ui.main_window as main_window  # noqa: E402
+
+
+class WireSignalsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.window = main_window.MainWindow()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        _app.processEvents()
+
+    def test_rewiring_logs_nothing(self) -> None:
+        with mock.patch.object(main_window, "_log_error") as log_error:
+            self.window._wire_signals()
+            self.window._wire_signals()
+        log_error.assert_not_called()
+
+    def test_rewiring_does_not_duplicate_slots(self) -> None:
+        self.window._wire_signals()
+        # the slider is connected to the bound request_save_state, so count the timer restarts it makes
+        with mock.patch.object(self.window._save_timer, "start") as start:
+            self.window.lily_mood_slider.setValue(self.window.lily_mood_slider.value() + 1)
+        self.assertEqual(start.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
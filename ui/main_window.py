@@ -1,9 +1,10 @@
-import datetime
-from PyQt6 import QtWidgets
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
+from functools import partial
+from hashlib import blake2b
+from operator import attrgetter
+from types import MappingProxyType
+from PyQt6.QtCore import QByteArray, QRunnable, QSettings, QThreadPool, Qt, QDateTime, QSize, QTimer, pyqtSlot
 from PyQt6.QtGui import QCloseEvent
-from PyQt6.QtWidgets import QApplication, QTextEdit, QPushButton, QDialog, QFormLayout, QLineEdit
-from PyQt6.QtPrintSupport import QPrintDialog
+from PyQt6.QtWidgets import QApplication, QMainWindow
 
 import tracker_config as tkc
 
@@ -32,6 +33,7 @@ from utility.app_operations.frameless_window import (
 from utility.app_operations.window_controls import (
     WindowController)
 from utility.widgets_set_widgets.slider_spinbox_connections import (
+    ValueThrottler,
     connect_slider_spinbox)
 
 ##############################################################################
@@ -45,10 +47,6 @@ from database.database_manager import (
 from database.database_utility.delete_records import (
     delete_selected_rows)
 
-# setup Models
-from database.database_utility.model_setup import (
-    create_and_set_model)
-
 # add lily mods walk diet and mood
 from database.add_data.time_in_room import add_time_in_room_data
 from database.add_data.mood import add_lily_mood_data
@@ -57,8 +55,217 @@ from database.add_data.walks import add_lily_walk_data
 from database.add_data.lily_notes import add_lily_note_data
 from database.add_data.walk_notes import add_lily_walk_notes
 
+# bound once so the except paths skip the module-global + attribute lookup
+_log_error = logger.error
+
+# the TypeError messages PyQt uses when a UniqueConnection already exists; the second one is
+# reported for slots decorated with @pyqtSlot
+_DUPLICATE_CONNECTION = ("connection is not unique", "connect() failed between")
+
+
+def _connect_unique(signal, slot, connection_type: Qt.ConnectionType = Qt.ConnectionType.AutoConnection) -> None:
+    """
+    Connects a slot to a signal with Qt.ConnectionType.UniqueConnection added to `connection_type`.
+
+    PyQt raises TypeError when the identical connection already exists; that connection is
+    kept as is, so wiring the same slot twice never makes it fire twice. Any other TypeError
+    (e.g. a slot whose signature does not match the signal) is raised to the caller.
+
+    Args:
+        signal: The bound signal to connect.
+        slot: The bound method (or cached callable) to connect to it.
+        connection_type (Qt.ConnectionType): DirectConnection for signals that are only ever emitted
+            on the GUI thread; the AutoConnection default for signals emitted from another thread.
+
+    Returns:
+        None
+
+    Raises:
+        TypeError: If the connection fails for any reason other than already existing.
+    """
+    try:
+        # PyQt6's ConnectionType is a plain Enum, so the flags are combined through their values
+        signal.connect(slot, Qt.ConnectionType(connection_type.value | Qt.ConnectionType.UniqueConnection.value))
+    except TypeError as e:
+        if not any(message in str(e) for message in _DUPLICATE_CONNECTION):
+            raise
+
+
+def _digest(data) -> bytes:
+    """
+    Returns a short fingerprint of a saved geometry/state blob, used to skip rewriting unchanged values.
+
+    Args:
+        data (QByteArray): The blob from saveGeometry()/saveState() or QSettings.
+
+    Returns:
+        bytes: An 8-byte blake2b digest.
+    """
+    return blake2b(bytes(data), digest_size=8).digest()
 
-class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
+
+def _open_settings() -> QSettings:
+    """
+    Opens the application's settings: a plain user-scope INI file instead of the registry/plist native backend.
+
+    Used by MainWindow and by _SaveStateTask, so both always read and write the same file.
+
+    Returns:
+        QSettings: The settings object, with fallbacks to the system scope disabled.
+    """
+    settings = QSettings(QSettings.Format.IniFormat, QSettings.Scope.UserScope,
+                         tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+    settings.setFallbacksEnabled(False)
+    return settings
+
+
+class _SaveStateTask(QRunnable):
+    """
+    Writes a settings snapshot from a QThreadPool thread, so closing the window does not wait on the INI write.
+    """
+
+    def __init__(self, write, snapshot: dict) -> None:
+        """
+        Initializes the _SaveStateTask.
+
+        Args:
+            write: The callable that writes the snapshot, given its own QSettings.
+            snapshot (dict): The values collected on the GUI thread.
+
+        Returns:
+            None
+        """
+        super().__init__()
+        self._write = write
+        self._snapshot = snapshot
+
+    def run(self) -> None:
+        """
+        Writes the snapshot to a QSettings object opened on the pool thread.
+
+        Returns:
+            None
+        """
+        # QSettings is reentrant but not shareable across threads, so the task opens its own
+        self._write(_open_settings(), self._snapshot)
+
+
+# fixed window sizes for the input and data view pages, built once and reused by every page switch
+_INPUT_SIZE = QSize(275, 315)
+_DATA_SIZE = QSize(850, 450)
+
+# widget attribute names handed to the add_lily_* commit helpers
+_DIET_FIELDS = MappingProxyType({
+    "lily_date": "lily_date", "lily_time": "lily_time",
+})
+_MOOD_FIELDS = MappingProxyType({
+    "lily_date": "lily_date",
+    "lily_time": "lily_time",
+    "lily_mood_slider": "lily_mood_slider",
+    "lily_energy_slider": "lily_energy_slider",
+    "lily_mood_activity_slider": "lily_mood_activity_slider",
+})
+_NOTES_FIELDS = MappingProxyType({
+    "lily_date": "lily_date", "lily_time": "lily_time",
+    "lily_notes": "lily_notes",
+})
+_WALK_FIELDS = MappingProxyType({
+    "lily_date": "lily_date", "lily_time": "lily_time",
+    "lily_behavior_slider": "lily_behavior_slider",
+    "lily_gait_slider": "lily_gait_slider",
+})
+_ROOM_FIELDS = MappingProxyType({
+    "lily_date": "lily_date", "lily_time": "lily_time",
+    "lily_time_in_room_slider": "lily_time_in_room_slider",
+})
+_WALK_NOTES_FIELDS = MappingProxyType({
+    "lily_date": "lily_date", "lily_time": "lily_time",
+    "lily_walk_note": "lily_walk_note",
+})
+
+
+def _resolve_widgets(window, fields):
+    """
+    Looks up the widgets named in a field map once, so the commit helpers get them directly.
+
+    Args:
+        window: The window that owns the widgets.
+        fields (Mapping[str, str]): Field name -> widget attribute name.
+
+    Returns:
+        MappingProxyType: A read-only field name -> widget mapping.
+    """
+    return MappingProxyType({key: getattr(window, name) for key, name in fields.items()})
+
+
+class MainWindow(FramelessWindow, QMainWindow, Ui_MainWindow):
+    # (settings key, widget attribute) pairs persisted through QSettings
+    _PERSISTED_WIDGETS = (
+        ('lily_time_in_room_slider', 'lily_time_in_room_slider'),
+        ('lily_mood_slider', 'lily_mood_slider'),
+        ('lily_mood_activity_slider', 'lily_mood_activity_slider'),
+        ('lily_energy_slider', 'lily_energy_slider'),
+        ('lily_time_in_room', 'lily_time_in_room'),
+        ('lily_mood', 'lily_mood'),
+        ('lily_activity', 'lily_activity'),
+        ('lily_energy', 'lily_energy'),
+    )
+    # (settings key, widget attribute, getter, setter, default, type) rows driving save/restore;
+    # the notes come last so the comparatively expensive toHtml() runs after the cheap reads
+    _PERSISTED_STATE = tuple(
+        (key, attr, 'value', 'setValue', 0, int) for key, attr in _PERSISTED_WIDGETS
+    ) + (
+        ('lily_notes', 'lily_notes', 'toHtml', 'setHtml', "", str),
+    )
+    # (action attribute, lilyStack page index) pairs
+    _STACK_NAVIGATION = (
+        ('action_input_page', 0),
+        ('action_data_view_page', 1),
+    )
+    # (slider attribute, spinbox attribute) pairs kept in sync by slider_set_spinbox
+    _SLIDER_SPINBOX_PAIRS = (
+        ('lily_time_in_room_slider', 'lily_time_in_room'),
+        ('lily_mood_slider', 'lily_mood'),
+        ('lily_mood_activity_slider', 'lily_activity'),
+        ('lily_gait_slider', 'lily_gait'),
+        ('lily_behavior_slider', 'lily_behavior'),
+        ('lily_energy_slider', 'lily_energy'),
+    )
+    # (signal path, slot name) pairs connected by _wire_signals
+    _SIGNAL_WIRING = (
+        ('action_input_page.triggered', 'switch_to_input_page_size_setter'),
+        ('action_data_view_page.triggered', 'switch_to_dataview_size_setter'),
+        ('lilyStack.currentChanged', 'on_page_changed'),
+        ('lily_ate_check.clicked', '_on_commit_diet'),
+        ('action_commit_mood.triggered', '_on_commit_mood'),
+        ('lily_walk_btn.clicked', '_on_commit_walk'),
+        ('action_commit_room_time.triggered', '_on_commit_room_time'),
+        ('lily_note_commit_btn.clicked', '_on_commit_notes'),
+        ('lily_walk_note_commit_btn.clicked', '_on_commit_walk_notes'),
+        ('action_delete_record.triggered', '_on_delete'),
+    )
+    # (signal path, slot name) pairs emitted from the storage worker thread; these must stay queued
+    _WORKER_WIRING = (
+        ('db_manager.storage_worker.written', 'on_table_written'),
+    )
+    # (table view attribute, model attribute) pairs handled by action_delete_record
+    _DELETE_TARGETS = (
+        ('lily_walk_table', 'lily_walk_model'),
+        ('lily_diet_table', 'lily_diet_model'),
+        ('lily_mood_table', 'lily_mood_model'),
+        ('time_in_room_table', 'lily_room_model'),
+        ('lily_notes_table', 'lily_note_model'),
+        ('lily_walk_note_table', 'lily_walk_note_model'),
+    )
+    # database table -> model attribute refreshed after the storage worker commits to it
+    _TABLE_MODELS = {
+        'lily_diet_table': 'lily_diet_model',
+        'lily_mood_table': 'lily_mood_model',
+        'lily_walk_table': 'lily_walk_model',
+        'lily_in_room_table': 'lily_room_model',
+        'lily_notes_table': 'lily_note_model',
+        'lily_walk_notes_table': 'lily_walk_note_model',
+    }
     
     def __init__(self,
                  *args,
@@ -66,7 +273,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         Initializes the main window of the application.
 
-        This class inherits from `FramelessWindow`, `QtWidgets.QMainWindow`, and `Ui_MainWindow`.
+        This class inherits from `FramelessWindow`, `QMainWindow`, and `Ui_MainWindow`.
         It sets up the UI, database manager, QSettings, and various other operations.
 
         Parameters:
@@ -82,30 +289,57 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         self.lily_room_model = None
         self.lily_walk_model = None
         self.lily_mood_model = None
-        self.lily_mood_model = None
         self.lily_diet_model = None
-        self.ui = Ui_MainWindow()
         self.setupUi(self)
+        # table view widget -> (view attribute, model attribute) for the focused-table delete
+        self._delete_map = {getattr(self, view): (view, model) for view, model in self._DELETE_TARGETS}
+        # field name -> widget for each commit helper, resolved here instead of on every click
+        self._diet_widgets = _resolve_widgets(self, _DIET_FIELDS)
+        self._mood_widgets = _resolve_widgets(self, _MOOD_FIELDS)
+        self._notes_widgets = _resolve_widgets(self, _NOTES_FIELDS)
+        self._walk_widgets = _resolve_widgets(self, _WALK_FIELDS)
+        self._room_widgets = _resolve_widgets(self, _ROOM_FIELDS)
+        self._walk_notes_widgets = _resolve_widgets(self, _WALK_NOTES_FIELDS)
         # Database init
         self.db_manager = DataManager()
-        self.setup_models()
+        # the table models are created by setup_models the first time the data view is shown
+        self._models_ready: bool = False
+        # tables written while the data view was hidden; their models are re-selected when it is shown
+        self._stale_tables: set = set()
+        # the slider <-> spinbox throttlers, collected by slider_set_spinbox
+        self._throttlers: tuple = ()
         # QSettings settings_manager setup
-        self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+        self.settings = _open_settings()
+        self._migrate_legacy_settings()
+        # a stored index that cannot be read as an int is logged by _safe and falls back to the input page
+        self._last_page_index: int = self._safe(self.settings.value, "lastPageIndex", 0, type=int) or 0
+        # settings key -> digest of the geometry/state last read or written, filled by restore_state
+        self._window_digests: dict = {}
         self.restore_state()
+        self._settings_cache: dict = self.persisted_values()
+        # coalesce rapid slider/spinbox changes into one deferred save_state
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_state)
         self.text_edit_saver = TextEditSaver()
         self.window_controller = WindowController()
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        # built once so that re-wiring passes the same callables and UniqueConnection can dedupe them
+        self._navigation_slots = tuple(
+            (getattr(self, action).triggered, partial(change_lily_stack, self.lilyStack, page))
+            for action, page in self._STACK_NAVIGATION
+        )
+        self._wire_signals()
         self.widget_operations()
-        self.setup_database_commits()
-        self.setup_delete_actions()
         self.switch_to_input_page_size_setter()
     
     def switch_to_input_page_size_setter(self):
         """
-        Switches the current widget to the lilyInputPage and resizes the window to 240x275.
+        Switches the current widget to the lilyInputPage and fixes the window size to 275x315.
 
         This method sets the current widget of the lilyStack to the lilyInputPage, which is responsible for handling user input.
-        It also resizes the window to a fixed size of 240x275 pixels.
+        It also sets the window to a fixed size of 275x315 pixels; setFixedSize resizes the window itself.
 
         Parameters:
         - None
@@ -113,15 +347,19 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
         - None
         """
+        # resizing is not a user page change, keep it out of on_page_changed
+        self.lilyStack.blockSignals(True)
         self.lilyStack.setCurrentWidget(self.lilyInputPage)
-        self.resize(275, 315)
-        self.setFixedSize(275, 315)
+        self.lilyStack.blockSignals(False)
+        self.setFixedSize(_INPUT_SIZE)
     
     def switch_to_dataview_size_setter(self):
         """
         Switches to the data view and sets the size of the main window.
 
-        This method switches the current widget to the data view and sets the size of the main window to 850x450 pixels.
+        This method switches the current widget to the data view and sets the fixed size of the main window to 850x450 pixels.
+        The table models are created here the first time the data view is opened, and models of
+        tables written while the view was hidden are re-selected.
 
         Parameters:
         None
@@ -129,32 +367,47 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Returns:
         None
         """
+        self.lilyStack.blockSignals(True)
         self.lilyStack.setCurrentWidget(self.lilydataView)
-        self.resize(850, 450)
-        self.setFixedSize(850, 450)
+        self.lilyStack.blockSignals(False)
+        self.setup_models()
+        self._refresh_stale_models()
+        self.setFixedSize(_DATA_SIZE)
     
-    def setup_database_commits(self):
+    def _wire_signals(self) -> None:
         """
-        Sets up the database commits for Lily's data.
-
-        This method calls several other methods to commit Lily's data to the database,
-        including diet data, mood data, walk data, room data, notes data, and walk notes data.
+        Connects every action, button and widget signal of the main window in one pass.
 
-        Raises:
-            Exception: If an error occurs while setting up the commits.
+        Stack navigation is connected first from `_navigation_slots`, so that the page
+        switch runs before the page size setters; then each (signal path, slot name) pair
+        in `_SIGNAL_WIRING` is connected, followed by the persisted widgets' valueChanged
+        signals to `request_save_state`. Every connection is made unique, so calling this
+        again does not stack duplicate handlers. These signals are all emitted on the GUI
+        thread, so they are connected directly; only `_WORKER_WIRING` keeps AutoConnection,
+        which queues the storage worker's notifications onto the GUI thread.
+        Each connection fails on its own, so one bad entry is logged without skipping the rest.
 
+        Returns:
+            None
         """
-        try:
-            # setup lily commits (diet, mood, walk)
-            self.lily_diet_data_commit()
-            self.add_lily_mood_data()
-            self.lily_walk_commit()
-            self.lily_in_room_commit()
-            self.add_lily_notes_data()
-            self.add_lily_walk_notes_data()
-        
-        except Exception as e:
-            logger.error(f"Error occurred setting up commits {e}", exc_info=True)
+        direct = Qt.ConnectionType.DirectConnection
+        # (signal path, slot name, connection type); the navigation partials are connected first
+        wiring = (
+            *((signal_path, slot, direct) for signal_path, slot in self._SIGNAL_WIRING),
+            *((f"{attr}.valueChanged", 'request_save_state', direct) for _, attr in self._PERSISTED_WIDGETS),
+            *((signal_path, slot, Qt.ConnectionType.AutoConnection) for signal_path, slot in self._WORKER_WIRING),
+        )
+        # Main Stack Navigation
+        for signal, slot in self._navigation_slots:
+            try:
+                _connect_unique(signal, slot, direct)
+            except Exception as e:
+                _log_error(f"Error wiring stack navigation {e}", exc_info=True)
+        for signal_path, slot, connection_type in wiring:
+            try:
+                _connect_unique(attrgetter(signal_path)(self), getattr(self, slot), connection_type)
+            except Exception as e:
+                _log_error(f"Error wiring {signal_path} -> {slot}: {e}", exc_info=True)
     
     ##########################################################################################
     # Primary OPS
@@ -164,7 +417,7 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Performs the necessary widget operations.
 
         This method sets up the slider and spinbox, configures the auto date and time,
-        and handles the stack navigation. If any error occurs during the setup,
+        and restores the last stack page. If any error occurs during the setup,
         an error message is logged.
 
         Returns:
@@ -173,73 +426,93 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.slider_set_spinbox()
             self.auto_date_time()
-            self.stack_navigation()
-            self.action_input_page.triggered.connect(self.switch_to_input_page_size_setter)
-            self.action_data_view_page.triggered.connect(self.switch_to_dataview_size_setter)
-            self.lilyStack.currentChanged.connect(self.on_page_changed)
-            last_index = self.settings.value("lastPageIndex", 0, type=int)
-            self.lilyStack.setCurrentIndex(last_index)
+            self.lilyStack.setCurrentIndex(self._last_page_index)
         except Exception as e:
-            logger.error(f"Error setting up primary operations {e}", exc_info=True)
+            _log_error(f"Error setting up primary operations {e}", exc_info=True)
 
     #######################################################################
     # auto-DATE TIME
     #######################################################################
     def auto_date_time(self) -> None:
         """
-        Automatically sets the current date and time for the specified date and time edit widgets.
+        Automatically sets the current date and time for the date and time edit widgets.
 
-        This method sets the current date using QDate.currentDate() and the current time using QTime.currentTime()
-        for the specified date and time edit widgets.
+        This method reads the clock once with QDateTime.currentDateTime() and sets its date and time
+        components on the lily_date and lily_time edit widgets.
 
         Raises:
             Exception: If there is an error while setting the date and time.
 
         """
         try:
-            widget_date_edit = [self.lily_date]
-            widget_time_edit = [self.lily_time]
-            
-            for widget in widget_date_edit:
-                widget.setDate(QDate.currentDate())
-            for widget in widget_time_edit:
-                widget.setTime(QTime.currentTime())
+            now = QDateTime.currentDateTime()
+            self.lily_date.setDate(now.date())
+            self.lily_time.setTime(now.time())
         except Exception as e:
-            logger.exception(f"Auto-Date time failed to be so auto... {e}", exc_info=True)
+            _log_error(f"Auto-Date time failed to be so auto... {e}", exc_info=True)
     
+    @pyqtSlot(int)
     def on_page_changed(self, index):
         """
         Callback method triggered when the page is changed in the UI.
 
+        The index is only written to QSettings when it differs from the last stored value.
+
         Args:
             index (int): The index of the new page.
         """
+        if index == self._last_page_index:
+            return
+        self._last_page_index = index
         self.settings.setValue("lastPageIndex", index)
     
-    #########################################################################
-    # UPDATE TIME support
-    #########################################################################
-    @staticmethod
-    def update_time(state, time_label):
+    @pyqtSlot(str)
+    def on_table_written(self, table_name: str) -> None:
         """
-        Update the time displayed on the time_label widget based on the given state.
+        Refreshes the model of a table once the storage worker has committed rows to it.
 
-        Parameters:
-        state (int): The state of the time_label widget. If state is 2, the time will be updated.
-        time_label (QLabel): The QLabel widget to display the time.
+        While the data view is hidden the table is only marked stale, so commits made from the input
+        page do not re-select a table nobody is looking at. Notifications that arrive after
+        close_database has closed the connection are ignored.
 
-        Raises:
-        Exception: If there is an error updating the time.
+        Args:
+            table_name (str): The name of the table that was written to.
+        """
+        try:
+            if not self.db_manager.db.isOpen():
+                return
+            model = getattr(self, self._TABLE_MODELS[table_name])
+            if model is None:
+                return
+            if self.lilyStack.currentWidget() is not self.lilydataView:
+                self._stale_tables.add(table_name)
+                return
+            model.select()
+        except Exception as e:
+            _log_error(f"Error refreshing model for {table_name}: {e}", exc_info=True)
+    
+    def _refresh_stale_models(self) -> None:
+        """
+        Re-selects the models of the tables that on_table_written marked stale.
 
         Returns:
-        None
+            None
         """
         try:
-            if state == 2:  # checked state
-                current_time = QTime.currentTime()
-                time_label.setTime(current_time)
+            while self._stale_tables:
+                model = getattr(self, self._TABLE_MODELS[self._stale_tables.pop()])
+                if model is not None:
+                    model.select()
         except Exception as e:
-            logger.error(f"Error updating time. {e}", exc_info=True)
+            _log_error(f"Error refreshing stale models: {e}", exc_info=True)
+    
+    @pyqtSlot()
+    def request_save_state(self) -> None:
+        """
+        Schedules a deferred save_state, restarting the debounce timer on every call
+        so that a burst of slider/spinbox changes results in a single write.
+        """
+        self._save_timer.start()
     
     #######################################################################################
     # SLIDER UPDATES SPINBOX/VICE VERSA SETUP
@@ -249,413 +522,272 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         Connects sliders to their corresponding spinboxes.
 
         This method connects a set of sliders to their corresponding spinboxes
-        using a dictionary mapping. Each slider is connected to its respective
-        spinbox using the `connect_slider_spinbox` function.
+        using the `_SLIDER_SPINBOX_PAIRS` table of (slider, spinbox) attribute names.
+        Each slider is connected to its respective spinbox using the `connect_slider_spinbox` function.
 
         Returns:
             None
         """
-        connect_slider_to_spinbox = {
-            self.lily_time_in_room_slider: self.lily_time_in_room,
-            self.lily_mood_slider: self.lily_mood,
-            self.lily_mood_activity_slider: self.lily_activity,
-            self.lily_gait_slider: self.lily_gait,
-            self.lily_behavior_slider: self.lily_behavior,
-            self.lily_energy_slider: self.lily_energy,
-        }
-        
-        for slider, spinbox in connect_slider_to_spinbox.items():
-            connect_slider_spinbox(slider, spinbox)
+        for slider, spinbox in self._SLIDER_SPINBOX_PAIRS:
+            connect_slider_spinbox(getattr(self, slider), getattr(self, spinbox))
+        # looked up once; the commit slots and closeEvent flush them before reading the widgets
+        self._throttlers = tuple(self.findChildren(ValueThrottler))
     
-    #############################################################################################
-    # Agenda Journal Navigation
-    #############################################################################################
-    def stack_navigation(self):
+    def _flush_throttlers(self) -> None:
         """
-        Handles the stack navigation for the main window.
-
-        This method maps actions and buttons to stack page indices for the agenda journal.
-        It connects the actions to the corresponding pages in the stack.
-
-        Raises:
-            Exception: If an error occurs during the stack navigation.
+        Lands every pending throttled slider <-> spinbox sync, so the sliders hold the values the spinboxes show.
 
+        Returns:
+            None
         """
-        try:
-            # Mapping actions and buttons to stack page indices for the agenda journal
-            lilyStack_nav = {
-                self.action_input_page: 0, self.action_data_view_page: 1
-            }
-            
-            # Main Stack Navigation
-            for action, page in lilyStack_nav.items():
-                action.triggered.connect(
-                    lambda _, p=page: change_lily_stack(self.lilyStack, p))
-        
-        except Exception as e:
-            logger.error(f"An error has occurred: {e}", exc_info=True)
-
-    def lily_diet_data_commit(self):
+        for throttler in self._throttlers:
+            throttler.flush()
+    
+    @pyqtSlot()
+    def _on_commit_diet(self) -> None:
+        """Passes the resolved `_diet_widgets` to `add_lily_diet_data` with the diet table insert method."""
+        self._flush_throttlers()
+        add_lily_diet_data(self._diet_widgets, self.db_manager.insert_into_lily_diet_table)
+    
+    @pyqtSlot()
+    def _on_commit_mood(self) -> None:
+        """Passes the resolved `_mood_widgets` to `add_lily_mood_data` with the mood table insert method."""
+        self._flush_throttlers()
+        add_lily_mood_data(self._mood_widgets, self.db_manager.insert_into_lily_mood_table)
+    
+    @pyqtSlot()
+    def _on_commit_notes(self) -> None:
+        """Passes the resolved `_notes_widgets` to `add_lily_note_data` with the notes table insert method."""
+        self._flush_throttlers()
+        add_lily_note_data(self._notes_widgets, self.db_manager.insert_into_lily_notes_table)
+    
+    @pyqtSlot()
+    def _on_commit_walk(self) -> None:
+        """Passes the resolved `_walk_widgets` to `add_lily_walk_data` with the walk table insert method."""
+        self._flush_throttlers()
+        add_lily_walk_data(self._walk_widgets, self.db_manager.insert_into_wiggles_walks_table)
+    
+    @pyqtSlot()
+    def _on_commit_room_time(self) -> None:
+        """Passes the resolved `_room_widgets` to `add_time_in_room_data` with the time in room table insert method."""
+        self._flush_throttlers()
+        add_time_in_room_data(self._room_widgets, self.db_manager.insert_into_time_in_room_table)
+    
+    @pyqtSlot()
+    def _on_commit_walk_notes(self) -> None:
+        """Passes the resolved `_walk_notes_widgets` to `add_lily_walk_notes` with the walk notes table insert method."""
+        self._flush_throttlers()
+        add_lily_walk_notes(self._walk_notes_widgets, self.db_manager.insert_into_lily_walk_notes_table)
+    
+    def setup_models(self) -> None:
         """
-        Connects the `lily_ate_check` button click event to the `add_lily_diet_data` function.
+        Set up models for various tables in the main window.
 
-        The `add_lily_diet_data` function is called with the following parameters:
-        - `self`: The current instance of the class.
-        - A dictionary containing the data to be passed to the `add_lily_diet_data` function:
-            - "lily_date": The value of the "lily_date" attribute.
-            - "lily_time": The value of the "lily_time" attribute.
-            - "model": The value of the "lily_diet_model" attribute.
-        - `self.db_manager.insert_into_lily_diet_table`: The function to be called when the button is clicked.
+        This method creates and sets models for the following tables:
+        - lily_diet_table
+        - lily_mood_table
+        - lily_walk_table
+        - lily_in_room_table
+        - lily_notes_table
+        - lily_walk_notes_table
 
-        Raises:
-            Exception: If an error occurs during the execution of the method.
+        The models are only created once, on the first call; switch_to_dataview_size_setter calls this
+        when the data view is opened, so a session that only records data never selects the tables.
+        If an error occurs during the setup process, an error message is logged.
 
+        Returns:
+            None
         """
-        try:
-            self.lily_ate_check.clicked.connect(lambda: add_lily_diet_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "model": "lily_diet_model",
-            }, self.db_manager.insert_into_lily_diet_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+        if self._models_ready:
+            return
+        self._models_ready = True
+        try:
+            models = self.db_manager.create_models([
+                ("lily_diet_table", self.lily_diet_table),
+                ("lily_mood_table", self.lily_mood_table),
+                ("lily_walk_table", self.lily_walk_table),
+                ("lily_in_room_table", self.time_in_room_table),
+                ("lily_notes_table", self.lily_notes_table),
+                ("lily_walk_notes_table", self.lily_walk_note_table),
+            ])
+            self.lily_diet_model = models.get("lily_diet_table")
+            self.lily_mood_model = models.get("lily_mood_table")
+            self.lily_walk_model = models.get("lily_walk_table")
+            self.lily_room_model = models.get("lily_in_room_table")
+            self.lily_note_model = models.get("lily_notes_table")
+            self.lily_walk_note_model = models.get("lily_walk_notes_table")
+        except Exception as e:
+            _log_error(f"Error setting up models: {e}", exc_info=True)
     
-    def add_lily_mood_data(self):
+    @pyqtSlot()
+    def _on_delete(self) -> None:
         """
-        Connects the 'commit_mood' action to the 'add_lily_mood_data' function and passes the necessary data to it.
+        Deletes the selected rows from the table view that has keyboard focus.
 
-        This method connects the 'commit_mood' action to the 'add_lily_mood_data' function, which is responsible for inserting
-        Lily's mood data into the database. It sets up the necessary data and connects the action to the function using a lambda
-        function. The lambda function passes the required data and the function to be called when the action is triggered.
+        The focused widget (or the view it belongs to, e.g. a cell editor) is looked up in
+        `_delete_map`, so only that one table is touched. Nothing is deleted when no table has focus.
 
-        Parameters:
-            self (MainWindow): The instance of the main window.
-        
         Returns:
             None
         """
         try:
-            self.action_commit_mood.triggered.connect(lambda: add_lily_mood_data(self, {
-                "lily_date": "lily_date",
-                "lily_time": "lily_time",
-                "lily_mood_slider": "lily_mood_slider",
-                "lily_energy_slider": "lily_energy_slider",
-                "lily_mood_activity_slider": "lily_mood_activity_slider",
-                "model": "lily_mood_model",
-            }, self.db_manager.insert_into_lily_mood_table, ))
+            widget = QApplication.focusWidget()
+            while widget is not None and widget not in self._delete_map:
+                widget = widget.parentWidget()
+            if widget is None:
+                return
+            with self.db_manager.transaction():
+                delete_selected_rows(self, *self._delete_map[widget])
         except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+            _log_error(f"Error deleting selected records: {e}", exc_info=True)
     
-    def add_lily_notes_data(self):
+    def persisted_values(self) -> dict:
         """
-        Connects the 'commit_lily_notes' action to the 'add_lily_note_data' function.
+        Collects the current values of the widgets whose state is persisted in QSettings.
 
-        This method connects the 'commit_lily_notes' action to the 'add_lily_note_data' function,
-        passing the necessary parameters. It handles any exceptions that occur and logs an error message.
-
-        Parameters:
-        - self: The instance of the main window.
-        
         Returns:
-        - None
+            dict: A mapping of settings key to the widget's current value.
         """
-        try:
-            self.lily_note_commit_btn.clicked.connect(lambda: add_lily_note_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_notes": "lily_notes",
-                "model": "lily_note_model",
-            }, self.db_manager.insert_into_lily_notes_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+        return {key: getattr(getattr(self, attr), getter)()
+                for key, attr, getter, _, _, _ in self._PERSISTED_STATE}
     
-    def lily_walk_commit(self):
+    def _safe(self, fn, *args, **kwargs):
         """
-        Connects the `lily_walk_btn` button to the `add_lily_walk_data` function with specified arguments.
-
-        This method is responsible for setting up the connection between the `lily_walk_btn` button and the `add_lily_walk_data` function.
-        It passes a dictionary of data and a callback function to the `add_lily_walk_data` function.
+        Calls `fn` and logs any exception instead of raising it, so one failing setting does not stop the rest.
 
         Args:
-            self: The instance of the class.
+            fn: The callable to run.
+            *args: Positional arguments passed to `fn`.
+            **kwargs: Keyword arguments passed to `fn`.
 
         Returns:
-            None
-
-        Raises:
-            Exception: If an error occurs during the connection setup.
-
+            The result of `fn`, or None if it raised.
         """
         try:
-            self.lily_walk_btn.clicked.connect(lambda: add_lily_walk_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_behavior_slider": "lily_behavior_slider",
-                "lily_gait_slider": "lily_gait_slider",
-                "model": "lily_walk_model"
-            }, self.db_manager.insert_into_wiggles_walks_table, ))
+            return fn(*args, **kwargs)
         except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+            _log_error(f"Error in {getattr(fn, '__qualname__', fn)}: {e}", exc_info=True)
+            return None
     
-    def lily_in_room_commit(self):
+    def save_state(self):
         """
-        Connects the 'commit_room_time' action to the 'add_time_in_room_data' function,
-        passing the necessary parameters and inserting the data into the time in room table.
-
-        Raises:
-            Exception: If an error occurs during the commit process.
+        Saves the state of various components in the main window.
 
+        This method saves the state of different components in the main window, including Lily's mood settings,
+        Lily's walk modules settings, Lily's diet module settings, and the window geometry state.
+        Only values that changed since the last restore/save are written, all under the "lily" group,
+        followed by a single sync to the settings backend. Errors are logged per value by `_safe`.
         """
-        try:
-            self.action_commit_room_time.triggered.connect(lambda: add_time_in_room_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time", "lily_time_in_room_slider":
-                    "lily_time_in_room_slider", "model": "lily_room_model"
-            }, self.db_manager.insert_into_time_in_room_table))
-        except Exception as e:
-            logger.error(f"Error occurring during in_room commit main_window.py loc. {e}",
-                         exc_info=True)
+        self._write_snapshot(self.settings, self._snapshot())
     
-    def add_lily_walk_notes_data(self):
+    def _snapshot(self) -> dict:
         """
-        Connects the `lily_walk_btn` button to the `add_lily_walk_notes` function with specified arguments.
+        Collects the settings to save; widgets may only be read on the GUI thread, so this always runs there.
 
-        This method sets up the connection between the `lily_walk_btn` button and the `add_lily_walk_notes` function.
-        When the button is clicked, it calls the `add_lily_walk_notes` function with the provided arguments.
-
-        Args:
-            self: The instance of the main window class.
+        The cache is updated here, so values handed to a pending write are not collected again.
 
         Returns:
-            None
-
-        Raises:
-            Exception: If an error occurs during the connection setup.
-
-        """
-        try:
-            self.lily_walk_note_commit_btn.clicked.connect(lambda: add_lily_walk_notes(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_walk_note": "lily_walk_note", "model": "lily_walk_note_model"
-            }, self.db_manager.insert_into_lily_walk_notes_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+            dict: The changed "lily" group values and the changed window geometry/state blobs.
+        """
+        values = self._safe(self.persisted_values) or {}
+        changed = {key: value for key, value in values.items() if self._settings_cache.get(key) != value}
+        self._settings_cache.update(changed)
+        window = {}
+        for key, blob in (("geometry", self.saveGeometry()), ("windowState", self.saveState())):
+            digest = _digest(blob)
+            if self._window_digests.get(key) != digest:
+                self._window_digests[key] = digest
+                window[key] = blob
+        return {"lily": changed, "window": window}
     
-    def setup_models(self) -> None:
+    def _write_snapshot(self, settings: QSettings, snapshot: dict) -> None:
         """
-        Set up models for various tables in the main window.
+        Writes a `_snapshot` to the given settings object and syncs it once. Uses no widgets, so it may run off the GUI thread.
 
-        This method creates and sets models for the following tables:
-        - lily_diet_table
-        - lily_mood_table
-        - lily_walk_table
-        - lily_in_room_table
-        - lily_notes_table
-        - lily_walk_notes_table
-
-        If an error occurs during the setup process, an error message is logged.
+        Args:
+            settings (QSettings): The settings object to write to.
+            snapshot (dict): The values returned by `_snapshot`.
 
         Returns:
             None
         """
-        try:
-            self.lily_diet_model = create_and_set_model("lily_diet_table", self.lily_diet_table)
-            self.lily_mood_model = create_and_set_model("lily_mood_table", self.lily_mood_table)
-            self.lily_walk_model = create_and_set_model("lily_walk_table", self.lily_walk_table)
-            self.lily_room_model = create_and_set_model("lily_in_room_table",
-                                                        self.time_in_room_table)
-            self.lily_note_model = create_and_set_model("lily_notes_table", self.lily_notes_table)
-            self.lily_walk_note_model = create_and_set_model("lily_walk_notes_table",
-                                                             self.lily_walk_note_table)
-        except Exception as e:
-            logger.error(f"Error setting up models: {e}", exc_info=True)
+        if not snapshot["lily"] and not snapshot["window"]:
+            return
+        settings.beginGroup("lily")
+        try:
+            for key, value in snapshot["lily"].items():
+                self._safe(settings.setValue, key, value)
+        finally:
+            settings.endGroup()
+        # save window geometry state, only the blobs that changed
+        for key, blob in snapshot["window"].items():
+            self._safe(settings.setValue, key, blob)
+        self._safe(settings.sync)
     
-    def setup_delete_actions(self):
+    def _migrate_legacy_settings(self) -> None:
         """
-        Connects the delete action to the corresponding delete functions for different tables.
-
-        This method sets up the delete action for various tables in the UI. It connects the
-        `action_delete_record` trigger to the corresponding `delete_selected_rows` function
-        for each table.
-
-        Raises:
-            Exception: If an error occurs while setting up the delete actions.
-
-        """
-        try:
-            try:
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'lily_walk_table',
-                        'lily_walk_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-            try:                
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'lily_diet_table',
-                        'lily_diet_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-            try:
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'lily_mood_table',
-                        'lily_mood_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-            try:
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'time_in_room_table',
-                        'lily_room_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-            try:
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'lily_notes_table',
-                        'lily_note_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-            try:
-                self.action_delete_record.triggered.connect(
-                    lambda: delete_selected_rows(
-                        self,
-                        'lily_walk_note_table',
-                        'lily_walk_note_model'
-                    )
-                )
-            except Exception as e:
-                logger.error(f"Error setting up delete actions: {e}", exc_info=True)
-        except Exception as e:
-            logger.error(f"{e}", exc_info=True)
-    
-    def save_state(self):
-        """
-        Saves the state of various components in the main window.
+        Copies the settings of an older install into the INI file the first time it is used.
 
-        This method saves the state of different components in the main window, including Lily's mood settings,
-        Lily's walk modules settings, Lily's diet module settings, and the window geometry state.
-
-        Raises:
-            Exception: If there is an error while saving the state.
+        Older versions kept their settings in the platform's native store (registry, plist or
+        .conf), first as top-level keys and later under the "lily" group. When the INI file is
+        still empty, the persisted values, the window geometry/state and the last page index are
+        copied over once; the old store is left untouched.
 
+        Returns:
+            None
         """
-        try:
-            self.settings.setValue('lily_time_in_room_slider', self.lily_time_in_room_slider.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_mood_slider', self.lily_mood_slider.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_mood_activity_slider',
-                                   self.lily_mood_activity_slider.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_energy_slider', self.lily_energy_slider.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_time_in_room', self.lily_time_in_room.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_mood', self.lily_mood.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_activity', self.lily_activity.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_energy', self.lily_energy.value())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.settings.setValue('lily_notes', self.lily_notes.toHtml())
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-            # save window geometry state
-        try:
-            self.settings.setValue("geometry", self.saveGeometry())
-            self.settings.setValue("windowState", self.saveState())
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
+        if self.settings.allKeys():
+            return
+        legacy = self._safe(QSettings, tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+        if legacy is None or not legacy.allKeys():
+            return
+        self.settings.beginGroup("lily")
+        try:
+            for key, *_ in self._PERSISTED_STATE:
+                # the grouped key is the newer of the two layouts
+                for legacy_key in (f"lily/{key}", key):
+                    if legacy.contains(legacy_key):
+                        self._safe(self.settings.setValue, key, legacy.value(legacy_key))
+                        break
+        finally:
+            self.settings.endGroup()
+        for key in ("geometry", "windowState", "lastPageIndex"):
+            if legacy.contains(key):
+                self._safe(self.settings.setValue, key, legacy.value(key))
+        self._safe(self.settings.sync)
+        logger.info("Migrated settings from %s", legacy.fileName())
     
     def restore_state(self) -> None:
         """
-        Restores the state of various settings and managers, including sun,
-        moon, and weekday journals, diet settings, Lily's mood and walk settings,
-        sleep state, basics, wellbeing tracker, physical pain rate, and mental breakup.
-        Also restores window geometry and pushbutton disabled/enabled state.
-        """
-        try:
-            # restore window geometry state
-            self.restoreGeometry(self.settings.value("geometry", QByteArray()))
-        except Exception as e:
-            logger.error(f"Error restoring the minds module : stress state {e}")
-        try:
-            self.lily_time_in_room_slider.setValue(self.settings.value('lily_time_in_room_slider', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_mood_slider.setValue(self.settings.value('lily_mood_slider', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_mood_activity_slider.setValue(self.settings.value('lily_mood_activity_slider', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-            
-        try:
-            self.lily_energy_slider.setValue(self.settings.value('lily_energy_slider', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_time_in_room.setValue(self.settings.value('lily_time_in_room', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_mood.setValue(self.settings.value('lily_mood', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_activity.setValue(self.settings.value('lily_activity', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_energy.setValue(self.settings.value('lily_energy', 0, type=int))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.lily_notes.setHtml(self.settings.value('lily_notes', "", type=str))
-        except Exception as e:
-            logger.error(f'{e}', exc_info=True)
-        try:
-            self.restoreState(self.settings.value("windowState", QByteArray()))
-        except Exception as e:
-            logger.error(f"Error restoring WINDOW STATE {e}", exc_info=True)
+        Restores the state of Lily's mood, walk and room sliders/spinboxes, Lily's notes,
+        and the window geometry state. Errors are logged per value by `_safe`.
+        """
+        # restore window geometry state; value() returns None for a missing key, so one lookup is enough
+        geometry = self._safe(self.settings.value, "geometry")
+        if geometry is not None:
+            # a value that is not a QByteArray is left to restoreGeometry, which fails and is logged
+            if isinstance(geometry, QByteArray):
+                self._window_digests["geometry"] = _digest(geometry)
+            self._safe(self.restoreGeometry, geometry)
+        self.settings.beginGroup("lily")
+        try:
+            for key, attr, _, setter, default, value_type in self._PERSISTED_STATE:
+                value = self._safe(self.settings.value, key, default, type=value_type)
+                if value is not None:
+                    self._safe(getattr(getattr(self, attr), setter), value)
+        finally:
+            self.settings.endGroup()
+        window_state = self._safe(self.settings.value, "windowState")
+        if window_state is not None:
+            if isinstance(window_state, QByteArray):
+                self._window_digests["windowState"] = _digest(window_state)
+            self._safe(self.restoreState, window_state)
     
     def closeEvent(self, event: QCloseEvent) -> None:
         """
         Event handler for the close event of the main window.
 
-        Saves the state before closing the window.
+        Collects the state before closing the window and writes it from the global QThreadPool.
 
         Args:
             event (QCloseEvent): The close event object.
@@ -664,6 +796,15 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             None
         """
         try:
-            self.save_state()
+            # let queued inserts land and checkpoint the WAL before the window goes away
+            self.db_manager.close_database()
+        except Exception as e:
+            _log_error(f"error closing the database during closure: {e}", exc_info=True)
+        try:
+            # land any throttled slider <-> spinbox sync, then flush the pending debounced save
+            self._flush_throttlers()
+            self._save_timer.stop()
+            # read the widgets now, write the file on the pool; run_app waits for it before exiting
+            QThreadPool.globalInstance().start(_SaveStateTask(self._write_snapshot, self._snapshot()))
         except Exception as e:
-            logger.error(f"error saving state during closure: {e}", exc_info=True)
+            _log_error(f"error saving state during closure: {e}", exc_info=True)
@@ -1,11 +1,119 @@
+from typing import Optional, Union
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
 from PyQt6.QtWidgets import QSlider, QSpinBox
 from logger_setup import logger
 
+# how long a slider <-> spinbox sync waits for further values before forwarding the latest one
+THROTTLE_MS: int = 50
+
+
+class ValueThrottler(QObject):
+    """
+    Forwards an int valueChanged stream to a target widget's setValue at most once per interval.
+
+    The first value after a quiet period is forwarded at once; values arriving while the interval
+    is running only replace the pending value, which is forwarded when the interval ends. The
+    target's signals are blocked while it is set, so the sync does not echo back to the source.
+
+    Attributes:
+        target (Union[QSlider, QSpinBox]): The widget whose value is kept in sync.
+
+    Methods:
+        throttle(self, value): Receives a new value from the source widget.
+        flush(self): Forwards the pending value right away.
+    """
+
+    def __init__(self,
+                 target: Union[QSlider, QSpinBox],
+                 interval_ms: int = THROTTLE_MS,
+                 parent: Optional[QObject] = None) -> None:
+        """
+        Initializes the ValueThrottler.
+
+        Args:
+            target (Union[QSlider, QSpinBox]): The widget whose value is kept in sync.
+            interval_ms (int): The throttle interval in milliseconds.
+            parent (Optional[QObject]): The QObject that owns the throttler.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.target: Union[QSlider, QSpinBox] = target
+        self._pending: Optional[int] = None
+        self._timer: QTimer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._forward_pending)
+
+    @pyqtSlot(int)
+    def throttle(self, value: int) -> None:
+        """
+        Forwards the value now if no interval is running, otherwise keeps it as the pending value.
+
+        Args:
+            value (int): The source widget's new value.
+
+        Returns:
+            None
+        """
+        if self._timer.isActive():
+            self._pending = value
+            return
+        self._set_target(value)
+        self._timer.start()
+
+    def flush(self) -> None:
+        """
+        Forwards the pending value right away, e.g. before the widgets' state is saved.
+
+        Returns:
+            None
+        """
+        self._timer.stop()
+        if self._pending is not None:
+            value, self._pending = self._pending, None
+            self._set_target(value)
+
+    @pyqtSlot()
+    def _forward_pending(self) -> None:
+        """
+        Forwards the latest value received during the interval, if any.
+
+        Returns:
+            None
+        """
+        if self._pending is not None:
+            value, self._pending = self._pending, None
+            self._set_target(value)
+            # keep throttling while values keep arriving
+            self._timer.start()
+
+    def _set_target(self, value: int) -> None:
+        """
+        Sets the target's value without letting it re-emit valueChanged.
+
+        Args:
+            value (int): The value to set.
+
+        Returns:
+            None
+        """
+        blocked: bool = self.target.blockSignals(True)
+        self.target.setValue(value)
+        self.target.blockSignals(blocked)
+
 
 def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> None:
     """
     Connects a slider's valueChanged signal to a spinbox's setValue slot and vice versa.
 
+    Each direction goes through a ValueThrottler, so dragging a slider updates its spinbox at most
+    once per THROTTLE_MS with the latest value instead of on every step. The throttlers are owned
+    by the widget they listen to and set their target with its signals blocked, which breaks the
+    slider <-> spinbox cycle.
+
     Parameters:
         slider (QSlider): The slider object.
         spinbox (QSpinBox): The spinbox object.
@@ -17,10 +125,8 @@ def connect_slider_spinbox(slider: QSlider, spinbox: QSpinBox) -> None:
         if slider is not None and spinbox is not None:
             if isinstance(slider, QSlider) and isinstance(spinbox, QSpinBox):
                 # Connect the slider's valueChanged signal to the spinbox's setValue slot
-                slider.valueChanged.connect(spinbox.setValue)
+                slider.valueChanged.connect(ValueThrottler(spinbox, parent=slider).throttle)
                 # Connect the spinbox's valueChanged signal to the slider's setValue slot
-                spinbox.valueChanged.connect(slider.setValue)
-                # Add logger to track the success or failure of the connection process
+                spinbox.valueChanged.connect(ValueThrottler(slider, parent=spinbox).throttle)
     except Exception as e:
         logger.error(f"Error connecting signals and slots: {e}")
-        
\ No newline at end of file